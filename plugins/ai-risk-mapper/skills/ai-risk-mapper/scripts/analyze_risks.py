@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # /// script
+# requires-python = ">=3.10"
 # dependencies = [
 #   "pyyaml>=6.0.1",
 # ]
@@ -125,7 +126,7 @@ class TargetAnalyzer:
         if persona_filter:
             persona_id = f"persona{persona_filter}"
 
-        for risk in self.core.get_all_risks():
+        for risk in self.core.iter_risks():
             # Apply persona filter
             if persona_id and persona_id not in risk.personas:
                 continue
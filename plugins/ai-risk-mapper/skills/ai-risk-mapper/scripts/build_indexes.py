@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# /// script
+# requires-python = ">=3.10"
+# dependencies = ["pyyaml>=6.0.1"]
+# ///
+"""
+Build prebuilt lookup indexes for a CoSAI schema directory.
+
+Writes framework_index.json next to the YAML schemas so cli_framework_map.py
+can answer lookups with a single JSON read instead of parsing the YAML.
+The index records the SHA-1 of risks.yaml and is ignored once the schemas
+change, so rerun this after fetch_cosai_schemas.py or a bundled schema update.
+
+Usage:
+    uv run scripts/build_indexes.py [--offline] [--yaml-dir PATH]
+
+Examples:
+    uv run scripts/build_indexes.py              # ~/.cosai-cache/yaml
+    uv run scripts/build_indexes.py --offline    # bundled assets
+"""
+
+import argparse
+import json
+import sys
+
+from core_analyzer import FRAMEWORK_INDEX_FILE, RiskAnalyzer, build_framework_index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build CoSAI lookup indexes")
+    parser.add_argument("--offline", action="store_true", help="Index the bundled schemas")
+    parser.add_argument("--yaml-dir", help="Index a custom schema directory")
+    args = parser.parse_args()
+
+    try:
+        analyzer = RiskAnalyzer(yaml_dir=args.yaml_dir, offline=args.offline)
+    except FileNotFoundError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+    index = build_framework_index(analyzer)
+    index_path = analyzer.yaml_dir / FRAMEWORK_INDEX_FILE
+    index_path.write_text(json.dumps(index, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {len(index['risks'])} risks to {index_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,54 +1,84 @@
 #!/usr/bin/env python3
 # /// script
+# requires-python = ">=3.10"
 # dependencies = ["pyyaml>=6.0.1"]
 # ///
 """
 Get controls that mitigate a specific risk.
 
 Usage:
-    uv run scripts/cli_controls_for_risk.py <risk-id> [--offline]
+    uv run scripts/cli_controls_for_risk.py <risk-id> [--offline] [--no-cache]
 
 Examples:
     uv run scripts/cli_controls_for_risk.py DP
     uv run scripts/cli_controls_for_risk.py PIJ --offline
 """
 
-import argparse
 import sys
-from core_analyzer import RiskAnalyzer
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import argparse
+
+    from core_analyzer import RiskAnalyzer
+
+
+def parse_args(argv: list[str]) -> "argparse.Namespace":
+    """Parse command-line arguments."""
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(description="Get controls for a risk")
     parser.add_argument("risk_id", help="Risk identifier (e.g., DP, PIJ)")
     parser.add_argument("--offline", action="store_true", help="Use bundled schemas")
-    args = parser.parse_args()
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse schemas instead of using the analyzer cache")
+    return parser.parse_args(argv)
+
+
+@lru_cache(maxsize=4)
+def _get_analyzer(offline: bool, use_cache: bool = True) -> "RiskAnalyzer":
+    """Return one shared analyzer per schema source for repeated main() calls."""
+    # Imported here so --help and usage errors never load yaml or the schemas
+    from core_analyzer import load_analyzer
+
+    return load_analyzer(offline=offline, use_cache=use_cache)
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    risk_id, offline, no_cache = args.risk_id, args.offline, args.no_cache
 
     try:
-        analyzer = RiskAnalyzer(offline=args.offline)
+        analyzer = _get_analyzer(offline, not no_cache)
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    risk = analyzer.find_risk(args.risk_id)
+    risk = analyzer.find_risk(risk_id)
     if not risk:
-        print(f"Risk not found: {args.risk_id}", file=sys.stderr)
+        print(f"Risk not found: {risk_id}", file=sys.stderr)
         print(f"Available risks: {', '.join(analyzer.get_risk_ids())}")
         sys.exit(1)
 
-    controls = analyzer.get_controls_for_risk(args.risk_id)
-
-    print(f"Risk: [{risk.id}] {risk.title}")
-    print(f"Description: {risk.short_description.strip()[:200]}...")
-    print(f"\n{len(controls)} controls mitigate this risk:\n")
+    controls = analyzer.get_controls_for_risk(risk_id)
 
+    # Slicing before strip() bounds the strip cost; the outer slice keeps
+    # the original 200-character limit
+    short = risk.short_description
+    parts = [
+        f"Risk: [{risk.id}] {risk.title}\n",
+        f"Description: {short[:400].strip()[:200]}...\n",
+        f"\n{len(controls)} controls mitigate this risk:\n\n",
+    ]
     for i, control in enumerate(controls, 1):
-        print(f"{i}. [{control.id}] {control.title}")
-        desc = control.description[:200] + "..." if len(control.description) > 200 else control.description
-        print(f"   Description: {desc.strip()}")
+        parts.append(f"{i}. [{control.id}] {control.title}\n")
+        d = control.description
+        desc = (d[:200] + "...") if len(d) > 200 else d
+        parts.append(f"   Description: {desc.strip()}\n")
         if control.components:
-            print(f"   Components: {', '.join(control.components[:3])}")
-        print()
+            parts.append(f"   Components: {', '.join(control.components[:3])}\n")
+        parts.append("\n")
+    sys.stdout.write("".join(parts))
 
 
 if __name__ == "__main__":
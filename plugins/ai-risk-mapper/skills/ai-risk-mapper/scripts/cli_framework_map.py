@@ -1,12 +1,13 @@
 #!/usr/bin/env python3
 # /// script
+# requires-python = ">=3.10"
 # dependencies = ["pyyaml>=6.0.1"]
 # ///
 """
 Get framework mappings for a risk.
 
 Usage:
-    uv run scripts/cli_framework_map.py <risk-id> [--framework <name>] [--offline]
+    uv run scripts/cli_framework_map.py <risk-id> [--framework <name>] [--offline] [--no-cache]
 
 Examples:
     uv run scripts/cli_framework_map.py PIJ
@@ -14,54 +15,94 @@ Examples:
     uv run scripts/cli_framework_map.py SDD --offline
 """
 
-import argparse
 import sys
-from core_analyzer import RiskAnalyzer
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
+if TYPE_CHECKING:
+    import argparse
 
-FRAMEWORKS = ["mitre-atlas", "nist-ai-rmf", "stride", "owasp-llm", "iso-22989"]
+    from core_analyzer import RiskAnalyzer
 
 
-def main():
+# Immutable and ordered: argparse lists choices in this order in help text
+FRAMEWORKS = ("mitre-atlas", "nist-ai-rmf", "stride", "owasp-llm", "iso-22989")
+
+
+def parse_args(argv: list[str]) -> "argparse.Namespace":
+    """Parse command-line arguments."""
+    import argparse
+
     parser = argparse.ArgumentParser(description="Get framework mappings for a risk")
     parser.add_argument("risk_id", help="Risk identifier (e.g., DP, PIJ)")
     parser.add_argument("--framework", choices=FRAMEWORKS, help="Filter by framework")
     parser.add_argument("--offline", action="store_true", help="Use bundled schemas")
-    args = parser.parse_args()
+    parser.add_argument("--no-cache", action="store_true", help="Re-parse schemas instead of using the analyzer cache")
+    return parser.parse_args(argv)
+
+
+def render(risk_id: str, title: str, mappings: dict, framework: str | None) -> str:
+    """Format a risk's framework mappings for display."""
+    parts = [f"Risk: [{risk_id}] {title}\n", "\n"]
+
+    if framework:
+        refs = mappings.get(framework, [])
+        refs = refs if isinstance(refs, list) else [refs]
+        parts.append(f"{framework.upper()} Mappings:\n")
+        if refs:
+            parts.extend(f"  - {m}\n" for m in refs)
+        else:
+            parts.append("  (none)\n")
+    else:
+        parts.append("All Framework Mappings:\n")
+        if mappings:
+            for name, refs in mappings.items():
+                if refs:
+                    refs_str = ", ".join(str(r) for r in refs) if isinstance(refs, list) else str(refs)
+                    parts.append(f"  {name}: {refs_str}\n")
+        else:
+            parts.append("  (no mappings available)\n")
+
+    return "".join(parts)
+
+
+@lru_cache(maxsize=4)
+def _get_analyzer(offline: bool, use_cache: bool = True) -> "RiskAnalyzer":
+    """Return one shared analyzer per schema source for repeated main() calls."""
+    # Imported here so --help and usage errors never load yaml or the schemas
+    from core_analyzer import load_analyzer
+
+    return load_analyzer(offline=offline, use_cache=use_cache)
+
+
+def main():
+    args = parse_args(sys.argv[1:])
+    risk_id, framework = args.risk_id, args.framework
+    offline, no_cache = args.offline, args.no_cache
+
+    # Fast path: answer from the prebuilt index without parsing any YAML
+    if not no_cache:
+        from core_analyzer import BUNDLED_YAML_DIR, CACHED_YAML_DIR, read_framework_index
+
+        index = read_framework_index(BUNDLED_YAML_DIR if offline else CACHED_YAML_DIR)
+        entry = index.get(risk_id) if index else None
+        if entry:
+            sys.stdout.write(render(risk_id, entry["title"], entry["mappings"], framework))
+            return
 
     try:
-        analyzer = RiskAnalyzer(offline=args.offline)
+        analyzer = _get_analyzer(offline, not no_cache)
     except FileNotFoundError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
-    risk = analyzer.find_risk(args.risk_id)
+    risk = analyzer.find_risk(risk_id)
     if not risk:
-        print(f"Risk not found: {args.risk_id}", file=sys.stderr)
+        print(f"Risk not found: {risk_id}", file=sys.stderr)
         print(f"Available risks: {', '.join(analyzer.get_risk_ids())}")
         sys.exit(1)
 
-    print(f"Risk: [{risk.id}] {risk.title}")
-    print()
-
-    if args.framework:
-        mappings = analyzer.get_framework_mappings(args.risk_id, args.framework)
-        print(f"{args.framework.upper()} Mappings:")
-        if mappings:
-            for m in mappings:
-                print(f"  - {m}")
-        else:
-            print("  (none)")
-    else:
-        all_mappings = analyzer.get_all_framework_mappings(args.risk_id)
-        print("All Framework Mappings:")
-        if all_mappings:
-            for framework, refs in all_mappings.items():
-                if refs:
-                    refs_str = ", ".join(str(r) for r in refs) if isinstance(refs, list) else str(refs)
-                    print(f"  {framework}: {refs_str}")
-        else:
-            print("  (no mappings available)")
+    sys.stdout.write(render(risk.id, risk.title, risk.mappings, framework))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # /// script
+# requires-python = ">=3.10"
 # dependencies = ["pyyaml>=6.0.1"]
 # ///
 """
@@ -34,7 +35,7 @@ def main():
     persona = analyzer.find_persona(args.persona_id)
     if persona and persona.deprecated:
         print(f"Warning: '{args.persona_id}' is deprecated. Consider using an active persona instead.", file=sys.stderr)
-        print(f"Active personas: {', '.join(p.id for p in analyzer.get_all_personas() if not p.deprecated)}", file=sys.stderr)
+        print(f"Active personas: {', '.join(p.id for p in analyzer.iter_personas() if not p.deprecated)}", file=sys.stderr)
         print(file=sys.stderr)
 
     profile = analyzer.get_persona_risk_profile(args.persona_id)
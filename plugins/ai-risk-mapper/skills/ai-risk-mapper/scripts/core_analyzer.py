@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 # /// script
+# requires-python = ">=3.10"
 # dependencies = [
 #   "pyyaml>=6.0.1",
 # ]
@@ -28,22 +29,107 @@ Usage:
     controls = analyzer.get_controls_for_risk("DP")
     profile = analyzer.get_persona_risk_profile("personaModelProvider")
     gap = analyzer.assess_risk_gap("DP", ["controlTrainingDataSanitization"])
+
+    # CLI usage: reuse a pickled analyzer while the schemas are unchanged
+    analyzer = load_analyzer(offline=True)
 """
 
+import hashlib
 import json
 import logging
+import mmap
+import os
+import pickle
+import re
 import sys
+import tempfile
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import yaml
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefer the libyaml-backed loader, falling back to pure Python
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+T = TypeVar("T")
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Set once the active YAML loader has been logged
+_loader_logged = False
+
+# Bundled schemas shipped with the skill
+BUNDLED_YAML_DIR = Path(__file__).parent.parent / "assets" / "cosai-schemas" / "yaml"
+
+# Schemas downloaded by fetch_cosai_schemas.py
+CACHED_YAML_DIR = Path.home() / ".cosai-cache" / "yaml"
+
+# JSON copies of parsed schema files, reused while newer than the YAML
+JSON_CACHE_DIR = Path.home() / ".cosai-cache" / "json"
+
+# Pickled RiskAnalyzer instances, keyed by schema file mtimes
+ANALYZER_CACHE_DIR = Path.home() / ".cache" / "ai-risk-mapper"
+
+# Prebuilt {risk_id: {title, mappings}} lookup written by build_indexes.py
+FRAMEWORK_INDEX_FILE = "framework_index.json"
+
+# Schema files at least this large are memory-mapped for parsing
+MMAP_MIN_BYTES = 64 * 1024
+
+# Most recent search / gap-assessment results kept per analyzer
+QUERY_CACHE_SIZE = 256
+
+# Top-level "risks:" key opening the block-style list of risk entries
+_RISKS_KEY_RE = re.compile(rb"^risks:[ \t]*(?:#.*)?$", re.MULTILINE)
+
+# First list item under the "risks:" key, giving the entries' indentation
+_LIST_ITEM_RE = re.compile(rb"^([ \t]*)- ", re.MULTILINE)
+
+# Next top-level key, which ends the final list entry
+_TOP_LEVEL_KEY_RE = re.compile(rb"^[^\s#-]", re.MULTILINE)
+
 
-@dataclass
+def _risks_block(buf) -> Optional[Tuple[int, bytes]]:
+    """
+    Return (offset, indent) of the first entry in the "risks:" list.
+
+    Returns None when risks.yaml does not use the block-style layout the
+    byte-span scanner understands, so callers fall back to a full parse.
+    """
+    key = _RISKS_KEY_RE.search(buf)
+    if key is None:
+        return None
+    item = _LIST_ITEM_RE.search(buf, key.end())
+    if item is None or _TOP_LEVEL_KEY_RE.search(buf, key.end(), item.start()):
+        return None
+    return item.start(), item.group(1)
+
+
+@dataclass(frozen=True, slots=True)
 class Risk:
     """Represents a CoSAI security risk."""
 
@@ -61,7 +147,7 @@ class Risk:
     actor_access: List[str]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Control:
     """Represents a CoSAI security control."""
 
@@ -75,7 +161,7 @@ class Control:
     mappings: Dict[str, List[str]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Component:
     """Represents a CoSAI AI system component."""
 
@@ -86,7 +172,7 @@ class Component:
     edges: List[Dict[str, str]]
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Persona:
     """Represents a CoSAI stakeholder persona."""
 
@@ -99,6 +185,122 @@ class Persona:
     identification_questions: Optional[List[str]] = None
 
 
+def _log_yaml_loader() -> None:
+    """Log, once per process, whether the libyaml C loader is in use."""
+    global _loader_logged
+    if _loader_logged:
+        return
+    _loader_logged = True
+    if _SafeLoader.__name__ == "CSafeLoader":
+        logger.debug("Parsing YAML with libyaml (CSafeLoader)")
+    else:
+        logger.debug(
+            "libyaml not available; parsing YAML with the pure-Python SafeLoader"
+        )
+
+
+def _dumps(data: Any) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    # ensure_ascii=False matches orjson, so both paths give the same text
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _index_by(
+    items: Iterable[T], keys: Callable[[T], Union[str, Iterable[str]]]
+) -> Dict[str, List[T]]:
+    """Group items under each of their keys, preserving item order."""
+    index: Dict[str, List[T]] = defaultdict(list)
+    for item in items:
+        item_keys = keys(item)
+        # Some list fields hold a bare string such as "all"; treat it as one key
+        if isinstance(item_keys, str):
+            item_keys = (item_keys,)
+        # dict.fromkeys drops repeated keys so an item is listed once per key
+        for key in dict.fromkeys(item_keys):
+            index[key].append(item)
+    return dict(index)
+
+
+def _intern_id(value: Any) -> Any:
+    """Intern an ID string so repeated references share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _intern_ids(values: Any) -> Any:
+    """Intern every ID in a list field, leaving other shapes untouched."""
+    if type(values) is list:
+        return [sys.intern(v) if type(v) is str else v for v in values]
+    return _intern_id(values)
+
+
+def _json_sidecar_path(path: Path) -> Path:
+    """Return the JSON cache path for a YAML file, unique per source path."""
+    key = hashlib.sha1(str(path.resolve()).encode("utf-8")).hexdigest()[:16]
+    return JSON_CACHE_DIR / f"{key}-{path.name}.json"
+
+
+def _load_yaml(path: Path) -> Any:
+    """
+    Parse a YAML file, reusing its JSON sidecar when that is up to date.
+
+    JSON parses far faster than YAML, so the first load writes the parsed
+    data to JSON_CACHE_DIR and later processes read that instead. The
+    sidecar records the YAML file's exact mtime and size and is only used
+    while both match, so a replaced file is re-parsed even if its mtime
+    moved backwards. Cache failures fall back to parsing the YAML.
+    """
+    sidecar = _json_sidecar_path(path)
+    try:
+        st = path.stat()
+        raw = sidecar.read_bytes()
+        cached = orjson.loads(raw) if orjson else json.loads(raw)
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == st.st_mtime_ns
+            and cached.get("size") == st.st_size
+            and "data" in cached
+        ):
+            return cached["data"]
+    except (OSError, ValueError):
+        pass
+
+    # Bytes let the loader skip Python-level text decoding; large files are
+    # mapped so the loader reads pages directly instead of a buffered copy
+    with open(path, "rb") as f:
+        st = os.fstat(f.fileno())
+        if st.st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = yaml.load(mm, Loader=_SafeLoader)
+        else:
+            data = yaml.load(f, Loader=_SafeLoader)
+
+    try:
+        encoded = json.dumps(
+            {"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data}
+        ).encode("utf-8")
+    except (TypeError, ValueError):
+        # YAML-only types such as dates have no JSON form; skip the cache
+        return data
+    if json.loads(encoded)["data"] != data:
+        # JSON would turn non-string mapping keys into strings; skip the cache
+        return data
+    try:
+        sidecar.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=sidecar.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(encoded)
+            os.replace(tmp_path, sidecar)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not write JSON cache %s: %s", sidecar, e)
+    return data
+
+
 class RiskAnalyzer:
     """
     Core analyzer for CoSAI Risk Map data.
@@ -123,19 +325,15 @@ class RiskAnalyzer:
             self.yaml_dir = Path(yaml_dir)
         elif offline:
             # Use bundled schemas from assets directory
-            self.yaml_dir = (
-                Path(__file__).parent.parent / "assets" / "cosai-schemas" / "yaml"
-            )
+            self.yaml_dir = BUNDLED_YAML_DIR
         else:
             # Use cached schemas from user's home directory
-            self.yaml_dir = Path.home() / ".cosai-cache" / "yaml"
+            self.yaml_dir = CACHED_YAML_DIR
 
         self.offline = offline
-        self.risks: Dict[str, Risk] = {}
-        self.controls: Dict[str, Control] = {}
-        self.components: Dict[str, Component] = {}
-        self.personas: Dict[str, Persona] = {}
-        self.frameworks: Dict[str, Any] = {}
+        self._risk_cache: Dict[str, Risk] = {}
+        self._risk_control_sets: Dict[str, FrozenSet[str]] = {}
+        self._query_memo: Dict[Tuple[Any, ...], Any] = {}
 
         if not self.yaml_dir.exists():
             raise FileNotFoundError(
@@ -143,112 +341,330 @@ class RiskAnalyzer:
                 f"Run fetch_cosai_schemas.py first or use offline=True for bundled schemas."
             )
 
-        self._load_data()
+        _log_yaml_loader()
         logger.info(
-            "RiskAnalyzer initialized: %d risks, %d controls, %d components, %d personas",
-            len(self.risks),
-            len(self.controls),
-            len(self.components),
-            len(self.personas),
+            "RiskAnalyzer initialized: %s (schemas load on demand)", self.yaml_dir
         )
 
-    def _load_data(self) -> None:
-        """Load all YAML data files."""
-        self._load_risks()
-        self._load_controls()
-        self._load_components()
-        self._load_personas()
-        self._load_frameworks()
+    def load_all(self) -> None:
+        """
+        Parse every entity schema eagerly (e.g. before pickling the analyzer).
+
+        frameworks.yaml is left out: no query reads it, so it is only parsed
+        if a caller accesses .frameworks directly.
+        """
+        loaders = {
+            "risks": self._load_risks,
+            "controls": self._load_controls,
+            "components": self._load_components,
+            "personas": self._load_personas,
+        }
+        # Skip collections that an earlier lookup already loaded
+        pending = {n: f for n, f in loaders.items() if n not in self.__dict__}
+
+        loaded = {n: f() for n, f in pending.items()}
+
+        # Store where cached_property would, so later access skips parsing
+        self.__dict__.update(loaded)
+
+    @cached_property
+    def risks(self) -> Dict[str, Risk]:
+        """All risks keyed by ID, parsed from risks.yaml on first access."""
+        return self._load_risks()
+
+    @cached_property
+    def controls(self) -> Dict[str, Control]:
+        """All controls keyed by ID, parsed from controls.yaml on first access."""
+        return self._load_controls()
+
+    @cached_property
+    def components(self) -> Dict[str, Component]:
+        """All components keyed by ID, parsed from components.yaml on first access."""
+        return self._load_components()
+
+    @cached_property
+    def personas(self) -> Dict[str, Persona]:
+        """All personas keyed by ID, parsed from personas.yaml on first access."""
+        return self._load_personas()
+
+    @cached_property
+    def frameworks(self) -> Dict[str, Any]:
+        """
+        Raw frameworks.yaml contents, parsed on first access.
+
+        Framework references used by queries come from each risk's and
+        control's own mappings; this is only the frameworks' descriptive data.
+        """
+        return self._load_frameworks()
+
+    # Reverse indexes, built on first use from the loaded collections
+
+    @cached_property
+    def _risks_by_persona(self) -> Dict[str, List[Risk]]:
+        return _index_by(self.risks.values(), lambda r: r.personas)
+
+    @cached_property
+    def _risks_by_stage(self) -> Dict[str, List[Risk]]:
+        return _index_by(self.risks.values(), lambda r: r.lifecycle_stages)
+
+    @cached_property
+    def _risks_by_impact(self) -> Dict[str, List[Risk]]:
+        return _index_by(self.risks.values(), lambda r: r.impact_types)
+
+    @cached_property
+    def _risks_by_category(self) -> Dict[str, List[Risk]]:
+        return _index_by(self.risks.values(), lambda r: (r.category,))
+
+    @cached_property
+    def _risks_by_access(self) -> Dict[str, List[Risk]]:
+        return _index_by(self.risks.values(), lambda r: r.actor_access)
+
+    @cached_property
+    def _risks_by_control(self) -> Dict[str, List[Risk]]:
+        return _index_by(self.risks.values(), lambda r: r.controls)
+
+    @cached_property
+    def _risk_positions(self) -> Dict[str, int]:
+        return {risk_id: i for i, risk_id in enumerate(self.risks)}
+
+    @cached_property
+    def _controls_by_persona(self) -> Dict[str, List[Control]]:
+        return _index_by(self.controls.values(), lambda c: c.personas)
+
+    @cached_property
+    def _controls_by_component(self) -> Dict[str, List[Control]]:
+        return _index_by(self.controls.values(), lambda c: c.components)
+
+    @cached_property
+    def _controls_by_category(self) -> Dict[str, List[Control]]:
+        return _index_by(self.controls.values(), lambda c: (c.category,))
+
+    # Search corpora: each entity paired with its lowercased searchable text.
+    # Fields are joined with NUL so a keyword cannot match across two fields.
+
+    @cached_property
+    def _risk_search(self) -> List[Tuple[Risk, str]]:
+        return [
+            (r, f"{r.title}\0{r.short_description}\0{r.long_description}".lower())
+            for r in self.risks.values()
+        ]
+
+    @cached_property
+    def _control_search(self) -> List[Tuple[Control, str]]:
+        return [
+            (c, f"{c.title}\0{c.description}".lower()) for c in self.controls.values()
+        ]
+
+    @cached_property
+    def _component_search(self) -> List[Tuple[Component, str]]:
+        return [
+            (c, f"{c.title}\0{c.description}".lower())
+            for c in self.components.values()
+        ]
 
-    def _load_risks(self) -> None:
+    def _load_risks(self) -> Dict[str, Risk]:
         """Load risks from YAML."""
+        risks: Dict[str, Risk] = {}
         risks_file = self.yaml_dir / "risks.yaml"
         if not risks_file.exists():
             logger.warning("Risks file not found: %s", risks_file)
-            return
+            return risks
 
-        with open(risks_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(risks_file)
 
         for risk_data in data.get("risks", []):
-            risk = Risk(
-                id=risk_data.get("id", ""),
-                title=risk_data.get("title", ""),
-                short_description=self._flatten_text(
-                    risk_data.get("shortDescription", [])
-                ),
-                long_description=self._flatten_text(
-                    risk_data.get("longDescription", [])
-                ),
-                category=risk_data.get("category", ""),
-                personas=risk_data.get("personas", []),
-                controls=risk_data.get("controls", []),
-                examples=self._flatten_text_list(risk_data.get("examples", [])),
-                mappings=risk_data.get("mappings", {}),
-                lifecycle_stages=risk_data.get("lifecycleStage", []),
-                impact_types=risk_data.get("impactType", []),
-                actor_access=risk_data.get("actorAccess", []),
-            )
-            self.risks[risk.id] = risk
-        logger.debug("Loaded %d risks", len(self.risks))
+            risk = self._make_risk(risk_data)
+            risks[risk.id] = risk
+        logger.debug("Loaded %d risks", len(risks))
+        return risks
+
+    def _make_risk(self, risk_data: Dict[str, Any]) -> Risk:
+        """Build a Risk from its parsed YAML mapping."""
+        return Risk(
+            id=_intern_id(risk_data.get("id", "")),
+            title=risk_data.get("title", ""),
+            short_description=self._flatten_text(
+                risk_data.get("shortDescription", [])
+            ),
+            long_description=self._flatten_text(
+                risk_data.get("longDescription", [])
+            ),
+            category=_intern_id(risk_data.get("category", "")),
+            personas=_intern_ids(risk_data.get("personas", [])),
+            controls=_intern_ids(risk_data.get("controls", [])),
+            examples=self._flatten_text_list(risk_data.get("examples", [])),
+            mappings=risk_data.get("mappings", {}),
+            lifecycle_stages=_intern_ids(risk_data.get("lifecycleStage", [])),
+            impact_types=_intern_ids(risk_data.get("impactType", [])),
+            actor_access=_intern_ids(risk_data.get("actorAccess", [])),
+        )
 
-    def _load_controls(self) -> None:
+    @cached_property
+    def _risk_index(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Map each risk ID to the byte span of its entry in risks.yaml.
+
+        Built with a regex scan over the raw file, so it costs one read and no
+        YAML parsing. Returns an empty dict if the layout is not recognised.
+        """
+        risks_file = self.yaml_dir / "risks.yaml"
+        try:
+            raw = risks_file.read_bytes()
+        except OSError:
+            return {}
+
+        block = _risks_block(raw)
+        if block is None:
+            return {}
+        # Entries at the list's indentation are risks; deeper "- id:" lines
+        # belong to nested lists, and the first top-level key ends the list
+        start, indent = block
+        boundary = re.compile(
+            rb"^(?:" + re.escape(indent) + rb"- id:[ \t]*['\"]?([^'\"\s#]+)|[^\s#-])",
+            re.MULTILINE,
+        )
+
+        index: Dict[str, Tuple[int, int]] = {}
+        current: Optional[re.Match] = None
+        for match in boundary.finditer(raw, start):
+            if current is not None:
+                index[current.group(1).decode("utf-8")] = (current.start(), match.start())
+            if match.group(1) is None:
+                current = None
+                break
+            current = match
+        if current is not None:
+            index[current.group(1).decode("utf-8")] = (current.start(), len(raw))
+        return index
+
+    def _locate_risk(self, risk_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Find the byte span of one risk entry without indexing the whole file.
+
+        Scans risks.yaml (memory-mapped) only until the requested entry and the
+        start of the entry after it, so pages past that point are never read.
+        """
+        if "_risk_index" in self.__dict__:
+            return self._risk_index.get(risk_id)
+
+        risks_file = self.yaml_dir / "risks.yaml"
+        try:
+            with open(risks_file, "rb") as f, mmap.mmap(
+                f.fileno(), 0, access=mmap.ACCESS_READ
+            ) as mm:
+                block = _risks_block(mm)
+                if block is None:
+                    return None
+                start, indent = block
+                # Stops at the requested entry or the key after the list,
+                # whichever comes first
+                match = re.compile(
+                    rb"^(?:(" + re.escape(indent) + rb"- id:[ \t]*['\"]?"
+                    + re.escape(risk_id.encode("utf-8"))
+                    + rb"['\"]?[ \t]*(?:#.*)?$)|[^\s#-])",
+                    re.MULTILINE,
+                ).search(mm, start)
+                if match is None or match.group(1) is None:
+                    return None
+                end = re.compile(
+                    rb"^(?:" + re.escape(indent) + rb"- id:|[^\s#-])", re.MULTILINE
+                ).search(mm, match.end())
+                return match.start(), end.start() if end else len(mm)
+        except (OSError, ValueError):
+            # ValueError: mmap of an empty file
+            return None
+
+    def _load_risk(self, risk_id: str) -> Optional[Risk]:
+        """Parse a single risk entry from risks.yaml using its byte span."""
+        span = self._locate_risk(risk_id)
+        if span is None:
+            # Unknown ID, or a layout the scanner does not recognise
+            return None if self._risk_index else self.risks.get(risk_id)
+
+        start, end = span
+        with open(self.yaml_dir / "risks.yaml", "rb") as f:
+            f.seek(start)
+            chunk = f.read(end - start)
+
+        try:
+            entries = yaml.load(chunk, Loader=_SafeLoader)
+        except yaml.YAMLError as e:
+            logger.debug("Falling back to full parse for %s: %s", risk_id, e)
+            return self.risks.get(risk_id)
+        if not isinstance(entries, list) or len(entries) != 1:
+            return self.risks.get(risk_id)
+        return self._make_risk(entries[0])
+
+    def _load_controls(self) -> Dict[str, Control]:
         """Load controls from YAML."""
+        controls: Dict[str, Control] = {}
         controls_file = self.yaml_dir / "controls.yaml"
         if not controls_file.exists():
             logger.warning("Controls file not found: %s", controls_file)
-            return
+            return controls
 
-        with open(controls_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(controls_file)
 
         for control_data in data.get("controls", []):
             control = Control(
-                id=control_data.get("id", ""),
+                id=_intern_id(control_data.get("id", "")),
                 title=control_data.get("title", ""),
                 description=self._flatten_text(control_data.get("description", [])),
-                category=control_data.get("category", ""),
-                personas=control_data.get("personas", []),
-                components=control_data.get("components", []),
-                risks=control_data.get("risks", []),
+                category=_intern_id(control_data.get("category", "")),
+                personas=_intern_ids(control_data.get("personas", [])),
+                components=_intern_ids(control_data.get("components", [])),
+                risks=_intern_ids(control_data.get("risks", [])),
                 mappings=control_data.get("mappings", {}),
             )
-            self.controls[control.id] = control
-        logger.debug("Loaded %d controls", len(self.controls))
+            controls[control.id] = control
+        logger.debug("Loaded %d controls", len(controls))
+        return controls
 
-    def _load_components(self) -> None:
+    def _load_components(self) -> Dict[str, Component]:
         """Load components from YAML."""
+        components: Dict[str, Component] = {}
         components_file = self.yaml_dir / "components.yaml"
         if not components_file.exists():
             logger.warning("Components file not found: %s", components_file)
-            return
+            return components
 
-        with open(components_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(components_file)
 
         # Handle both flat and hierarchical component structures
         if "components" in data:
             for comp_data in data["components"]:
-                self._add_component(comp_data)
+                self._add_component(components, comp_data)
         elif "categories" in data:
-            self._extract_components(data.get("categories", []))
-        logger.debug("Loaded %d components", len(self.components))
+            self._extract_components(components, data.get("categories", []))
+        logger.debug("Loaded %d components", len(components))
+        return components
 
     def _extract_components(
-        self, categories: List[Dict], parent_id: Optional[str] = None
+        self,
+        components: Dict[str, Component],
+        categories: List[Dict],
+        parent_id: Optional[str] = None,
     ) -> None:
-        """Recursively extract components from hierarchical structure."""
-        for category in categories:
-            self._add_component(category, parent_id)
-            # Recursively extract subcategories
-            if "subcategory" in category:
-                self._extract_components(category["subcategory"], category.get("id"))
+        """Extract components from a hierarchical structure, depth first."""
+        # Explicit stack instead of recursion; children are pushed reversed
+        # so components are added in the same pre-order as the YAML
+        stack = [(category, parent_id) for category in reversed(categories)]
+        while stack:
+            category, parent = stack.pop()
+            self._add_component(components, category, parent)
+            subcategories = category.get("subcategory")
+            if subcategories:
+                category_id = category.get("id")
+                stack.extend((sub, category_id) for sub in reversed(subcategories))
 
     def _add_component(
-        self, comp_data: Dict[str, Any], parent_id: Optional[str] = None
+        self,
+        components: Dict[str, Component],
+        comp_data: Dict[str, Any],
+        parent_id: Optional[str] = None,
     ) -> None:
         """Add a single component to the components dictionary."""
-        component_id = comp_data.get("id", "")
+        component_id = _intern_id(comp_data.get("id", ""))
         if not component_id:
             return
 
@@ -256,24 +672,24 @@ class RiskAnalyzer:
             id=component_id,
             title=comp_data.get("title", ""),
             description=self._flatten_text(comp_data.get("description", [])),
-            category=parent_id or comp_data.get("category", "root"),
+            category=_intern_id(parent_id or comp_data.get("category", "root")),
             edges=comp_data.get("edges", []),
         )
-        self.components[component_id] = component
+        components[component_id] = component
 
-    def _load_personas(self) -> None:
+    def _load_personas(self) -> Dict[str, Persona]:
         """Load personas from YAML."""
+        personas: Dict[str, Persona] = {}
         personas_file = self.yaml_dir / "personas.yaml"
         if not personas_file.exists():
             logger.warning("Personas file not found: %s", personas_file)
-            return
+            return personas
 
-        with open(personas_file, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        data = _load_yaml(personas_file)
 
         for persona_data in data.get("personas", []):
             persona = Persona(
-                id=persona_data.get("id", ""),
+                id=_intern_id(persona_data.get("id", "")),
                 title=persona_data.get("title", ""),
                 description=self._flatten_text(persona_data.get("description", [])),
                 responsibilities=persona_data.get("responsibilities", []),
@@ -281,19 +697,20 @@ class RiskAnalyzer:
                 deprecated=persona_data.get("deprecated", False),
                 identification_questions=persona_data.get("identificationQuestions"),
             )
-            self.personas[persona.id] = persona
-        logger.debug("Loaded %d personas", len(self.personas))
+            personas[persona.id] = persona
+        logger.debug("Loaded %d personas", len(personas))
+        return personas
 
-    def _load_frameworks(self) -> None:
+    def _load_frameworks(self) -> Dict[str, Any]:
         """Load framework mappings from YAML if available."""
         frameworks_file = self.yaml_dir / "frameworks.yaml"
         if not frameworks_file.exists():
             logger.debug("Frameworks file not found (optional): %s", frameworks_file)
-            return
+            return {}
 
-        with open(frameworks_file, "r", encoding="utf-8") as f:
-            self.frameworks = yaml.safe_load(f) or {}
+        frameworks = _load_yaml(frameworks_file) or {}
         logger.debug("Loaded frameworks data")
+        return frameworks
 
     def _flatten_text(self, text_data: Any) -> str:
         """Flatten text data (string or list) into a single string."""
@@ -307,15 +724,46 @@ class RiskAnalyzer:
         """Flatten text data into a list of strings."""
         if isinstance(text_data, str):
             return [text_data]
-        if isinstance(text_data, list):
-            result = []
-            for item in text_data:
-                if isinstance(item, list):
-                    result.extend(str(i) for i in item if i)
-                elif item:
-                    result.append(str(item))
-            return result
-        return [str(text_data)] if text_data else []
+        if not isinstance(text_data, list):
+            return [str(text_data)] if text_data else []
+
+        # Called for every risk at load time; bind the list methods once and
+        # use exact type checks, since YAML only produces plain str and list
+        result: List[str] = []
+        append = result.append
+        extend = result.extend
+        for item in text_data:
+            if type(item) is list:
+                extend([i if type(i) is str else str(i) for i in item if i])
+            elif item:
+                append(item if type(item) is str else str(item))
+        return result
+
+    def _memoized(self, key: Tuple[Any, ...], compute: Callable[[], T]) -> T:
+        """
+        Return a cached query result, computing and storing it on a miss.
+
+        Keeps the QUERY_CACHE_SIZE most recently used results. Kept on the
+        instance rather than in functools.lru_cache so the analyzer stays
+        picklable and is not pinned in memory by a class-level cache.
+        """
+        memo = self._query_memo
+        try:
+            value = memo.pop(key)
+        except KeyError:
+            value = compute()
+            if len(memo) >= QUERY_CACHE_SIZE:
+                del memo[next(iter(memo))]
+        # Reinserting moves the key to the most-recently-used end
+        memo[key] = value
+        return value
+
+    def _controls_of(self, risk: Risk) -> FrozenSet[str]:
+        """Return a risk's control IDs as a cached frozenset for membership tests."""
+        controls = self._risk_control_sets.get(risk.id)
+        if controls is None:
+            controls = self._risk_control_sets[risk.id] = frozenset(risk.controls)
+        return controls
 
     # ========================================================================
     # Risk Operations
@@ -325,13 +773,33 @@ class RiskAnalyzer:
         """
         Find a risk by ID.
 
+        Until the full collection is loaded, only the requested entry of
+        risks.yaml is parsed, so one-off lookups skip the full parse.
+
         Args:
             risk_id: Risk identifier (e.g., 'DP' for Data Poisoning)
 
         Returns:
             Risk object or None if not found
         """
-        return self.risks.get(risk_id)
+        if "risks" in self.__dict__:
+            return self.risks.get(risk_id)
+
+        risk = self._risk_cache.get(risk_id)
+        if risk is None:
+            risk = self._load_risk(risk_id)
+            if risk is not None:
+                self._risk_cache[risk_id] = risk
+        return risk
+
+    def iter_risks(self) -> Iterator[Risk]:
+        """
+        Iterate over all risks without building a list.
+
+        Returns:
+            Iterator of all risks
+        """
+        return iter(self.risks.values())
 
     def get_all_risks(self) -> List[Risk]:
         """
@@ -340,7 +808,7 @@ class RiskAnalyzer:
         Returns:
             List of all risks
         """
-        return list(self.risks.values())
+        return list(self.iter_risks())
 
     def search_risks(self, keyword: str) -> List[Risk]:
         """
@@ -353,13 +821,26 @@ class RiskAnalyzer:
             List of matching risks
         """
         keyword_lower = keyword.lower()
-        return [
-            risk
-            for risk in self.risks.values()
-            if keyword_lower in risk.title.lower()
-            or keyword_lower in risk.short_description.lower()
-            or keyword_lower in risk.long_description.lower()
-        ]
+        return list(
+            self._memoized(
+                ("search_risks", keyword_lower),
+                lambda: tuple(
+                    r for r, text in self._risk_search if keyword_lower in text
+                ),
+            )
+        )
+
+    def iter_risks_by_persona(self, persona_id: str) -> Iterator[Risk]:
+        """
+        Iterate over risks relevant to a persona without building a list.
+
+        Args:
+            persona_id: Persona identifier
+
+        Returns:
+            Iterator of risks relevant to the persona
+        """
+        return iter(self._risks_by_persona.get(persona_id, ()))
 
     def get_risks_by_persona(self, persona_id: str) -> List[Risk]:
         """
@@ -371,7 +852,7 @@ class RiskAnalyzer:
         Returns:
             List of risks relevant to the persona
         """
-        return [risk for risk in self.risks.values() if persona_id in risk.personas]
+        return list(self.iter_risks_by_persona(persona_id))
 
     def get_risks_by_lifecycle_stage(self, stage: str) -> List[Risk]:
         """
@@ -383,9 +864,7 @@ class RiskAnalyzer:
         Returns:
             List of risks in that lifecycle stage
         """
-        return [
-            risk for risk in self.risks.values() if stage in risk.lifecycle_stages
-        ]
+        return list(self._risks_by_stage.get(stage, ()))
 
     def get_risks_by_impact_type(self, impact_type: str) -> List[Risk]:
         """
@@ -397,9 +876,7 @@ class RiskAnalyzer:
         Returns:
             List of risks with that impact type
         """
-        return [
-            risk for risk in self.risks.values() if impact_type in risk.impact_types
-        ]
+        return list(self._risks_by_impact.get(impact_type, ()))
 
     def get_risks_by_category(self, category: str) -> List[Risk]:
         """
@@ -411,7 +888,7 @@ class RiskAnalyzer:
         Returns:
             List of risks in that category
         """
-        return [risk for risk in self.risks.values() if risk.category == category]
+        return list(self._risks_by_category.get(category, ()))
 
     def get_risks_by_component(self, component_id: str) -> List[Risk]:
         """
@@ -423,19 +900,15 @@ class RiskAnalyzer:
         Returns:
             List of risks relevant to that component
         """
-        # Find controls that protect this component
-        relevant_control_ids = {
-            control.id
-            for control in self.controls.values()
-            if component_id in control.components
-        }
+        # Risks mitigated by any control that protects this component
+        matched: Dict[str, Risk] = {}
+        for control in self._controls_by_component.get(component_id, ()):
+            for risk in self._risks_by_control.get(control.id, ()):
+                matched[risk.id] = risk
 
-        # Find risks that are mitigated by these controls
-        return [
-            risk
-            for risk in self.risks.values()
-            if any(control_id in risk.controls for control_id in relevant_control_ids)
-        ]
+        # Report in risks.yaml order, as a full scan would
+        positions = self._risk_positions
+        return sorted(matched.values(), key=lambda r: positions[r.id])
 
     def get_risks_by_actor_access(self, access_level: str) -> List[Risk]:
         """
@@ -448,11 +921,7 @@ class RiskAnalyzer:
         Returns:
             List of risks that can be exploited at this access level
         """
-        return [
-            risk
-            for risk in self.risks.values()
-            if access_level in risk.actor_access
-        ]
+        return list(self._risks_by_access.get(access_level, ()))
 
     # ========================================================================
     # Control Operations
@@ -470,6 +939,15 @@ class RiskAnalyzer:
         """
         return self.controls.get(control_id)
 
+    def iter_controls(self) -> Iterator[Control]:
+        """
+        Iterate over all controls without building a list.
+
+        Returns:
+            Iterator of all controls
+        """
+        return iter(self.controls.values())
+
     def get_all_controls(self) -> List[Control]:
         """
         Get all controls.
@@ -477,7 +955,7 @@ class RiskAnalyzer:
         Returns:
             List of all controls
         """
-        return list(self.controls.values())
+        return list(self.iter_controls())
 
     def search_controls(self, keyword: str) -> List[Control]:
         """
@@ -490,12 +968,14 @@ class RiskAnalyzer:
             List of matching controls
         """
         keyword_lower = keyword.lower()
-        return [
-            control
-            for control in self.controls.values()
-            if keyword_lower in control.title.lower()
-            or keyword_lower in control.description.lower()
-        ]
+        return list(
+            self._memoized(
+                ("search_controls", keyword_lower),
+                lambda: tuple(
+                    c for c, text in self._control_search if keyword_lower in text
+                ),
+            )
+        )
 
     def get_controls_for_risk(self, risk_id: str) -> List[Control]:
         """
@@ -507,7 +987,7 @@ class RiskAnalyzer:
         Returns:
             List of applicable controls
         """
-        risk = self.risks.get(risk_id)
+        risk = self.find_risk(risk_id)
         if not risk:
             return []
 
@@ -515,6 +995,18 @@ class RiskAnalyzer:
             self.controls[cid] for cid in risk.controls if cid in self.controls
         ]
 
+    def iter_controls_by_persona(self, persona_id: str) -> Iterator[Control]:
+        """
+        Iterate over controls relevant to a persona without building a list.
+
+        Args:
+            persona_id: Persona identifier
+
+        Returns:
+            Iterator of controls for the persona
+        """
+        return iter(self._controls_by_persona.get(persona_id, ()))
+
     def get_controls_by_persona(self, persona_id: str) -> List[Control]:
         """
         Get all controls relevant to a specific persona.
@@ -525,11 +1017,7 @@ class RiskAnalyzer:
         Returns:
             List of controls for the persona
         """
-        return [
-            control
-            for control in self.controls.values()
-            if persona_id in control.personas
-        ]
+        return list(self.iter_controls_by_persona(persona_id))
 
     def get_controls_by_component(self, component_id: str) -> List[Control]:
         """
@@ -541,11 +1029,7 @@ class RiskAnalyzer:
         Returns:
             List of controls protecting that component
         """
-        return [
-            control
-            for control in self.controls.values()
-            if component_id in control.components
-        ]
+        return list(self._controls_by_component.get(component_id, ()))
 
     def get_controls_by_category(self, category: str) -> List[Control]:
         """
@@ -557,9 +1041,7 @@ class RiskAnalyzer:
         Returns:
             List of controls in that category
         """
-        return [
-            control for control in self.controls.values() if control.category == category
-        ]
+        return list(self._controls_by_category.get(category, ()))
 
     # ========================================================================
     # Component Operations
@@ -577,6 +1059,15 @@ class RiskAnalyzer:
         """
         return self.components.get(component_id)
 
+    def iter_components(self) -> Iterator[Component]:
+        """
+        Iterate over all components without building a list.
+
+        Returns:
+            Iterator of all components
+        """
+        return iter(self.components.values())
+
     def get_all_components(self) -> List[Component]:
         """
         Get all components.
@@ -584,7 +1075,7 @@ class RiskAnalyzer:
         Returns:
             List of all components
         """
-        return list(self.components.values())
+        return list(self.iter_components())
 
     def search_components(self, keyword: str) -> List[Component]:
         """
@@ -597,12 +1088,14 @@ class RiskAnalyzer:
             List of matching components
         """
         keyword_lower = keyword.lower()
-        return [
-            component
-            for component in self.components.values()
-            if keyword_lower in component.title.lower()
-            or keyword_lower in component.description.lower()
-        ]
+        return list(
+            self._memoized(
+                ("search_components", keyword_lower),
+                lambda: tuple(
+                    c for c, text in self._component_search if keyword_lower in text
+                ),
+            )
+        )
 
     def get_component_edges(self, component_id: str) -> List[Dict[str, str]]:
         """
@@ -635,6 +1128,15 @@ class RiskAnalyzer:
         """
         return self.personas.get(persona_id)
 
+    def iter_personas(self) -> Iterator[Persona]:
+        """
+        Iterate over all personas without building a list.
+
+        Returns:
+            Iterator of all personas
+        """
+        return iter(self.personas.values())
+
     def get_all_personas(self) -> List[Persona]:
         """
         Get all personas.
@@ -642,7 +1144,7 @@ class RiskAnalyzer:
         Returns:
             List of all personas
         """
-        return list(self.personas.values())
+        return list(self.iter_personas())
 
     # ========================================================================
     # Framework Operations
@@ -659,7 +1161,7 @@ class RiskAnalyzer:
         Returns:
             List of framework references
         """
-        risk = self.risks.get(risk_id)
+        risk = self.find_risk(risk_id)
         if not risk:
             return []
 
@@ -696,7 +1198,7 @@ class RiskAnalyzer:
         Returns:
             Dictionary of framework name to list of references
         """
-        risk = self.risks.get(risk_id)
+        risk = self.find_risk(risk_id)
         if not risk:
             return {}
         return risk.mappings
@@ -718,12 +1220,29 @@ class RiskAnalyzer:
         Returns:
             Assessment dictionary with coverage and gaps
         """
-        risk = self.risks.get(risk_id)
+        result = self._memoized(
+            ("assess_risk_gap", risk_id, frozenset(implemented_controls)),
+            lambda: self._assess_risk_gap(risk_id, implemented_controls),
+        )
+        # Fresh lists so callers cannot alter the memoized result
+        if "error" in result:
+            return dict(result)
+        return {
+            **result,
+            "missing_controls": list(result["missing_controls"]),
+            "implemented_controls": list(result["implemented_controls"]),
+        }
+
+    def _assess_risk_gap(
+        self, risk_id: str, implemented_controls: List[str]
+    ) -> Dict[str, Any]:
+        """Compute assess_risk_gap's result without memoization."""
+        risk = self.find_risk(risk_id)
         if not risk:
             return {"error": f"Risk not found: {risk_id}"}
 
-        applicable_controls = set(risk.controls)
-        implemented_set = set(implemented_controls) & applicable_controls
+        applicable_controls = self._controls_of(risk)
+        implemented_set = applicable_controls.intersection(implemented_controls)
         gaps = applicable_controls - implemented_set
 
         coverage = (
@@ -760,17 +1279,14 @@ class RiskAnalyzer:
         if not persona:
             return {"error": f"Persona not found: {persona_id}"}
 
-        relevant_risks = self.get_risks_by_persona(persona_id)
+        # Copy and group the indexed risks in a single pass
+        relevant_risks: List[Risk] = []
+        risks_by_category: Dict[str, List[Risk]] = defaultdict(list)
+        for risk in self.iter_risks_by_persona(persona_id):
+            relevant_risks.append(risk)
+            risks_by_category[risk.category].append(risk)
         relevant_controls = self.get_controls_by_persona(persona_id)
 
-        # Group risks by category
-        risks_by_category: Dict[str, List[Risk]] = {}
-        for risk in relevant_risks:
-            category = risk.category
-            if category not in risks_by_category:
-                risks_by_category[category] = []
-            risks_by_category[category].append(risk)
-
         return {
             "persona_id": persona_id,
             "persona_title": persona.title,
@@ -779,7 +1295,7 @@ class RiskAnalyzer:
             "risks_count": len(relevant_risks),
             "controls_count": len(relevant_controls),
             "risks": relevant_risks,
-            "risks_by_category": risks_by_category,
+            "risks_by_category": dict(risks_by_category),
             "controls": relevant_controls,
         }
 
@@ -813,10 +1329,14 @@ class RiskAnalyzer:
         Returns:
             Risk as dictionary or None
         """
-        risk = self.risks.get(risk_id)
+        risk = self.find_risk(risk_id)
         if not risk:
             return None
+        return self._risk_to_dict(risk)
 
+    @staticmethod
+    def _risk_to_dict(risk: Risk) -> Dict[str, Any]:
+        """Convert a risk to its exported camelCase dictionary."""
         return {
             "id": risk.id,
             "title": risk.title,
@@ -845,7 +1365,11 @@ class RiskAnalyzer:
         control = self.controls.get(control_id)
         if not control:
             return None
+        return self._control_to_dict(control)
 
+    @staticmethod
+    def _control_to_dict(control: Control) -> Dict[str, Any]:
+        """Convert a control to its exported dictionary."""
         return {
             "id": control.id,
             "title": control.title,
@@ -864,10 +1388,7 @@ class RiskAnalyzer:
         Returns:
             JSON string of all risks
         """
-        risks_list = [
-            self.export_risk_as_dict(rid) for rid in self.risks.keys()
-        ]
-        return json.dumps(risks_list, indent=2)
+        return self._risks_json
 
     def export_all_controls_as_json(self) -> str:
         """
@@ -876,15 +1397,53 @@ class RiskAnalyzer:
         Returns:
             JSON string of all controls
         """
-        controls_list = [
-            self.export_control_as_dict(cid) for cid in self.controls.keys()
-        ]
-        return json.dumps(controls_list, indent=2)
+        return self._controls_json
+
+    # The data never changes after loading, so each export is serialized once
+
+    @cached_property
+    def _risks_json(self) -> str:
+        return _dumps([self._risk_to_dict(risk) for risk in self.risks.values()])
+
+    @cached_property
+    def _controls_json(self) -> str:
+        return _dumps([self._control_to_dict(c) for c in self.controls.values()])
 
     # ========================================================================
     # Utility Methods
     # ========================================================================
 
+    # Lazily built lookups that clear_caches() discards
+    _DERIVED_CACHES = (
+        "_risks_by_persona",
+        "_risks_by_stage",
+        "_risks_by_impact",
+        "_risks_by_category",
+        "_risks_by_access",
+        "_risks_by_control",
+        "_risk_positions",
+        "_controls_by_persona",
+        "_controls_by_component",
+        "_controls_by_category",
+        "_risk_search",
+        "_control_search",
+        "_component_search",
+        "_risks_json",
+        "_controls_json",
+    )
+
+    def clear_caches(self) -> None:
+        """
+        Drop memoized query results and derived indexes.
+
+        Loaded risks, controls, components and personas are kept; everything
+        derived from them is rebuilt on next use.
+        """
+        self._query_memo.clear()
+        self._risk_control_sets.clear()
+        for name in self._DERIVED_CACHES:
+            self.__dict__.pop(name, None)
+
     def get_statistics(self) -> Dict[str, int]:
         """
         Get basic statistics about the loaded data.
@@ -892,6 +1451,7 @@ class RiskAnalyzer:
         Returns:
             Dictionary with counts of each entity type
         """
+        # Touches each collection, parsing any that have not loaded yet
         return {
             "total_risks": len(self.risks),
             "total_controls": len(self.controls),
@@ -901,7 +1461,9 @@ class RiskAnalyzer:
 
     def get_risk_ids(self) -> List[str]:
         """Get all risk IDs."""
-        return list(self.risks.keys())
+        if "risks" in self.__dict__ or not self._risk_index:
+            return list(self.risks.keys())
+        return list(self._risk_index.keys())
 
     def get_control_ids(self) -> List[str]:
         """Get all control IDs."""
@@ -916,6 +1478,138 @@ class RiskAnalyzer:
         return list(self.personas.keys())
 
 
+def _file_sha1(path: Path) -> str:
+    """Return the SHA-1 hex digest of a file's contents."""
+    return hashlib.sha1(path.read_bytes()).hexdigest()
+
+
+def build_framework_index(analyzer: RiskAnalyzer) -> Dict[str, Any]:
+    """
+    Build the framework lookup index for an analyzer's schema directory.
+
+    Args:
+        analyzer: Loaded analyzer whose risks should be indexed
+
+    Returns:
+        Index dictionary, stamped with the SHA-1 of the source risks.yaml
+    """
+    return {
+        "risksSha1": _file_sha1(analyzer.yaml_dir / "risks.yaml"),
+        "risks": {
+            risk.id: {"title": risk.title, "mappings": risk.mappings}
+            for risk in analyzer.iter_risks()
+        },
+    }
+
+
+def read_framework_index(yaml_dir: Path) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Read the prebuilt framework index for a schema directory.
+
+    Args:
+        yaml_dir: Schema directory containing risks.yaml and the index
+
+    Returns:
+        Mapping of risk ID to {"title", "mappings"}, or None if the index is
+        missing, unreadable, or was built from a different risks.yaml
+    """
+    index_path = yaml_dir / FRAMEWORK_INDEX_FILE
+    try:
+        index = json.loads(index_path.read_bytes())
+        if index.get("risksSha1") != _file_sha1(yaml_dir / "risks.yaml"):
+            logger.debug("Ignoring stale framework index: %s", index_path)
+            return None
+        return index["risks"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        return None
+
+
+def _analyzer_cache_path(yaml_dir: Path) -> Path:
+    """Return the pickle cache path for a schema directory.
+
+    There is one file per directory; its contents are replaced whenever the
+    cache key changes, so schema edits never leave stale pickles behind.
+    """
+    key = hashlib.sha1(str(yaml_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return ANALYZER_CACHE_DIR / f"analyzer-{key}.pkl"
+
+
+def _analyzer_cache_key(yaml_dir: Path) -> str:
+    """Build the key stored with a pickled analyzer.
+
+    The key covers every YAML file's name, mtime, and size plus this module's
+    own mtime, so editing either the schemas or the loader invalidates it.
+    """
+    digest = hashlib.sha1()
+    for path in sorted(yaml_dir.glob("*.yaml")) + [Path(__file__)]:
+        stat = path.stat()
+        digest.update(f"{path.name}:{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def load_analyzer(
+    yaml_dir: Optional[Union[str, Path]] = None,
+    offline: bool = False,
+    use_cache: bool = True,
+) -> RiskAnalyzer:
+    """
+    Load a RiskAnalyzer, reusing a pickled instance when the schemas are unchanged.
+
+    Args:
+        yaml_dir: Path to the YAML data directory. If None, uses default paths.
+        offline: If True and yaml_dir is None, uses bundled assets.
+        use_cache: If False, always parse the YAML and skip the pickle cache.
+
+    Returns:
+        Fully loaded RiskAnalyzer
+
+    Raises:
+        FileNotFoundError: If the schema directory does not exist
+    """
+    if not use_cache:
+        return RiskAnalyzer(yaml_dir=yaml_dir, offline=offline)
+
+    if yaml_dir:
+        resolved_dir = Path(yaml_dir)
+    else:
+        resolved_dir = BUNDLED_YAML_DIR if offline else CACHED_YAML_DIR
+    if not resolved_dir.exists():
+        # Let the constructor raise its usual error message
+        return RiskAnalyzer(yaml_dir=yaml_dir, offline=offline)
+
+    cache_path = _analyzer_cache_path(resolved_dir)
+    cache_key = _analyzer_cache_key(resolved_dir)
+    try:
+        with open(cache_path, "rb") as f:
+            stored_key, analyzer = pickle.load(f)
+        if stored_key == cache_key:
+            logger.debug("Loaded analyzer from cache: %s", cache_path)
+            return analyzer
+        logger.debug("Analyzer cache %s is out of date", cache_path)
+    except FileNotFoundError:
+        pass
+    except (
+        OSError, pickle.UnpicklingError, EOFError, AttributeError, TypeError, ValueError
+    ) as e:
+        logger.debug("Ignoring unreadable analyzer cache %s: %s", cache_path, e)
+
+    analyzer = RiskAnalyzer(yaml_dir=yaml_dir, offline=offline)
+    analyzer.load_all()
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((cache_key, analyzer), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError as e:
+        logger.debug("Could not write analyzer cache %s: %s", cache_path, e)
+    return analyzer
+
+
 def main():
     """Example usage of the RiskAnalyzer."""
     # Configure logging for CLI usage
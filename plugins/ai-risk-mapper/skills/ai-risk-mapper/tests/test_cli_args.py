@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "pytest>=7.0",
+# ]
+# ///
+"""
+Test suite for the risk lookup CLIs' argument parsing.
+
+Tests cover:
+- cli_controls_for_risk.py and cli_framework_map.py option forms
+- Usage errors (exit status 2)
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import cli_controls_for_risk
+import cli_framework_map
+
+
+class TestControlsForRiskArgs:
+    """Test cli_controls_for_risk.parse_args()"""
+
+    def test_defaults(self):
+        args = cli_controls_for_risk.parse_args(["DP"])
+        assert (args.risk_id, args.offline, args.no_cache) == ("DP", False, False)
+
+    def test_flags_in_any_position(self):
+        args = cli_controls_for_risk.parse_args(["--no-cache", "DP", "--offline"])
+        assert (args.risk_id, args.offline, args.no_cache) == ("DP", True, True)
+
+    def test_abbreviated_flags(self):
+        args = cli_controls_for_risk.parse_args(["DP", "--off", "--no-c"])
+        assert args.offline and args.no_cache
+
+    @pytest.mark.parametrize("argv", [[], ["DP", "PIJ"], ["DP", "--bogus"], ["DP", "--offline=1"]])
+    def test_usage_errors(self, argv, capsys):
+        with pytest.raises(SystemExit) as exc:
+            cli_controls_for_risk.parse_args(argv)
+        assert exc.value.code == 2
+        assert "usage:" in capsys.readouterr().err
+
+
+class TestFrameworkMapArgs:
+    """Test cli_framework_map.parse_args()"""
+
+    def test_defaults(self):
+        args = cli_framework_map.parse_args(["DP"])
+        assert args.risk_id == "DP"
+        assert args.framework is None
+        assert not args.offline and not args.no_cache
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["DP", "--framework", "stride"],
+            ["DP", "--framework=stride"],
+            ["--framework", "stride", "DP"],
+            ["DP", "--fr", "stride"],
+            ["DP", "--fr=stride"],
+        ],
+    )
+    def test_framework_forms(self, argv):
+        args = cli_framework_map.parse_args(argv)
+        assert (args.risk_id, args.framework) == ("DP", "stride")
+
+    def test_every_framework_is_accepted(self):
+        for framework in cli_framework_map.FRAMEWORKS:
+            args = cli_framework_map.parse_args(["DP", f"--framework={framework}"])
+            assert args.framework == framework
+
+    @pytest.mark.parametrize(
+        "argv, message",
+        [
+            (["DP", "--framework"], "expected one argument"),
+            (["DP", "--framework", "bogus"], "invalid choice: 'bogus'"),
+            (["DP", "--framework=bogus"], "invalid choice: 'bogus'"),
+            (["DP", "--bogus"], "unrecognized arguments: --bogus"),
+            (["--offline"], "required: risk_id"),
+        ],
+    )
+    def test_usage_errors(self, argv, message, capsys):
+        with pytest.raises(SystemExit) as exc:
+            cli_framework_map.parse_args(argv)
+        assert exc.value.code == 2
+        assert message in capsys.readouterr().err
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
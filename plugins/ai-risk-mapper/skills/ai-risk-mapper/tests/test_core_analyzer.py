@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "pytest>=7.0",
+#   "pyyaml>=6.0.1",
+# ]
+# ///
+"""
+Test suite for core_analyzer.py loading logic.
+
+Tests cover:
+- Lazy single-risk lookup (byte-span index) against the eager full parse
+- JSON sidecar cache for parsed YAML files
+- Pickled analyzer cache (load_analyzer)
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+import core_analyzer
+from core_analyzer import RiskAnalyzer, _json_sidecar_path, _load_yaml, load_analyzer
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches(tmp_path, monkeypatch):
+    """Keep every on-disk cache inside the test's temp directory."""
+    monkeypatch.setattr(core_analyzer, "JSON_CACHE_DIR", tmp_path / "json-cache")
+    monkeypatch.setattr(core_analyzer, "ANALYZER_CACHE_DIR", tmp_path / "analyzer-cache")
+
+
+RISKS_YAML = """\
+title: Risks
+risks:
+  - id: riskAlpha
+    title: Alpha
+    controls:
+      - controlOne
+    examples:
+      - id: nestedExample
+        title: Not a risk
+  - id: 'riskBeta'  # quoted, with a comment
+    title: Beta
+    controls: []
+  - id: riskGamma
+    title: Gamma
+    controls:
+      - controlTwo
+definitions:
+  - id: notARisk
+"""
+
+
+def _write_schema(tmp_path: Path, risks_yaml: str) -> Path:
+    yaml_dir = tmp_path / "yaml"
+    yaml_dir.mkdir()
+    (yaml_dir / "risks.yaml").write_text(risks_yaml, encoding="utf-8")
+    return yaml_dir
+
+
+class TestLazyRiskLookup:
+    """find_risk() before load_all() must match the fully parsed risks"""
+
+    def test_bundled_risks_match_eager_parse(self):
+        eager = RiskAnalyzer(offline=True).risks
+        assert eager
+
+        lazy = RiskAnalyzer(offline=True)
+        for risk_id, risk in eager.items():
+            assert lazy.find_risk(risk_id) == risk, risk_id
+        # Every lookup was answered without parsing the whole collection
+        assert "risks" not in lazy.__dict__
+
+    def test_bundled_index_covers_every_risk(self):
+        analyzer = RiskAnalyzer(offline=True)
+        assert set(analyzer._risk_index) == set(analyzer.risks)
+
+    def test_synthetic_layout(self, tmp_path):
+        yaml_dir = _write_schema(tmp_path, RISKS_YAML)
+        eager = RiskAnalyzer(yaml_dir=yaml_dir).risks
+        assert list(eager) == ["riskAlpha", "riskBeta", "riskGamma"]
+
+        lazy = RiskAnalyzer(yaml_dir=yaml_dir)
+        # Last entry ends at the next top-level key, not the end of file
+        assert lazy.find_risk("riskGamma") == eager["riskGamma"]
+        assert lazy.find_risk("riskBeta") == eager["riskBeta"]
+        assert lazy.find_risk("riskAlpha") == eager["riskAlpha"]
+        assert "risks" not in lazy.__dict__
+
+    def test_nested_and_unknown_ids_are_not_risks(self, tmp_path):
+        yaml_dir = _write_schema(tmp_path, RISKS_YAML)
+        for risk_id in ("nestedExample", "notARisk", "riskMissing"):
+            analyzer = RiskAnalyzer(yaml_dir=yaml_dir)
+            assert analyzer._locate_risk(risk_id) is None
+            assert analyzer.find_risk(risk_id) is None
+
+    def test_index_and_scan_agree(self, tmp_path):
+        yaml_dir = _write_schema(tmp_path, RISKS_YAML)
+        scanned = RiskAnalyzer(yaml_dir=yaml_dir)
+        indexed = RiskAnalyzer(yaml_dir=yaml_dir)
+        index = indexed._risk_index
+        assert list(index) == ["riskAlpha", "riskBeta", "riskGamma"]
+        for risk_id in ("riskAlpha", "riskBeta", "riskGamma"):
+            assert scanned._locate_risk(risk_id) == index[risk_id]
+            assert indexed._locate_risk(risk_id) == index[risk_id]
+
+    def test_unrecognised_layout_falls_back_to_full_parse(self, tmp_path):
+        yaml_dir = _write_schema(
+            tmp_path, 'risks: [{id: riskFlow, title: Flow, controls: []}]\n'
+        )
+        analyzer = RiskAnalyzer(yaml_dir=yaml_dir)
+        risk = analyzer.find_risk("riskFlow")
+        assert risk is not None and risk.title == "Flow"
+
+
+class TestJsonSidecar:
+    """_load_yaml() must never return data that differs from the YAML"""
+
+    def test_sidecar_is_written_and_reused(self, tmp_path):
+        path = tmp_path / "controls.yaml"
+        path.write_text("controls:\n  - id: controlOne\n", encoding="utf-8")
+        expected = {"controls": [{"id": "controlOne"}]}
+
+        assert _load_yaml(path) == expected
+        assert _json_sidecar_path(path).exists()
+        assert _load_yaml(path) == expected
+
+    def test_replaced_file_with_older_mtime_is_reparsed(self, tmp_path):
+        path = tmp_path / "controls.yaml"
+        path.write_text("controls:\n  - id: controlOld\n", encoding="utf-8")
+        assert _load_yaml(path) == {"controls": [{"id": "controlOld"}]}
+        old = path.stat()
+
+        # A copy that preserves an older mtime, as shutil.copy2 does
+        path.write_text("controls:\n  - id: controlNewer\n", encoding="utf-8")
+        os.utime(path, ns=(old.st_atime_ns, old.st_mtime_ns - 10**9))
+
+        assert _load_yaml(path) == {"controls": [{"id": "controlNewer"}]}
+
+    def test_same_mtime_different_size_is_reparsed(self, tmp_path):
+        path = tmp_path / "controls.yaml"
+        path.write_text("controls: []\n", encoding="utf-8")
+        assert _load_yaml(path) == {"controls": []}
+        old = path.stat()
+
+        path.write_text("controls:\n  - id: controlTwo\n", encoding="utf-8")
+        os.utime(path, ns=(old.st_atime_ns, old.st_mtime_ns))
+
+        assert _load_yaml(path) == {"controls": [{"id": "controlTwo"}]}
+
+    def test_non_string_keys_survive(self, tmp_path):
+        path = tmp_path / "mappings.yaml"
+        path.write_text("1: a\ntrue: b\nname: c\n", encoding="utf-8")
+        expected = {1: "a", True: "b", "name": "c"}
+
+        assert _load_yaml(path) == expected
+        # A second load must not come back with stringified keys
+        assert _load_yaml(path) == expected
+        assert not _json_sidecar_path(path).exists()
+
+    def test_old_format_sidecar_is_ignored(self, tmp_path):
+        path = tmp_path / "controls.yaml"
+        path.write_text("controls: []\n", encoding="utf-8")
+        sidecar = _json_sidecar_path(path)
+        sidecar.parent.mkdir(parents=True)
+        sidecar.write_text('{"controls": [{"id": "stale"}]}', encoding="utf-8")
+
+        assert _load_yaml(path) == {"controls": []}
+
+
+class TestAnalyzerCache:
+    """load_analyzer() keeps one up-to-date pickle per schema directory"""
+
+    def test_reuses_pickle_until_schema_changes(self, tmp_path):
+        yaml_dir = _write_schema(tmp_path, RISKS_YAML)
+        first = load_analyzer(yaml_dir=yaml_dir)
+        assert first.find_risk("riskAlpha").title == "Alpha"
+        assert load_analyzer(yaml_dir=yaml_dir) is not first
+
+        (yaml_dir / "risks.yaml").write_text(
+            RISKS_YAML.replace("title: Alpha", "title: Alpha Two"), encoding="utf-8"
+        )
+        assert load_analyzer(yaml_dir=yaml_dir).find_risk("riskAlpha").title == "Alpha Two"
+
+    def test_schema_edits_do_not_accumulate_pickles(self, tmp_path):
+        yaml_dir = _write_schema(tmp_path, RISKS_YAML)
+        for title in ("One", "Three", "Eleven"):
+            (yaml_dir / "risks.yaml").write_text(
+                RISKS_YAML.replace("title: Alpha", f"title: {title}"), encoding="utf-8"
+            )
+            assert load_analyzer(yaml_dir=yaml_dir).find_risk("riskAlpha").title == title
+
+        assert len(list(core_analyzer.ANALYZER_CACHE_DIR.glob("analyzer-*.pkl"))) == 1
+
+    def test_unreadable_pickle_is_rebuilt(self, tmp_path):
+        yaml_dir = _write_schema(tmp_path, RISKS_YAML)
+        cache_path = core_analyzer._analyzer_cache_path(yaml_dir)
+        cache_path.parent.mkdir(parents=True)
+        cache_path.write_bytes(b"not a pickle")
+
+        assert load_analyzer(yaml_dir=yaml_dir).find_risk("riskBeta").title == "Beta"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
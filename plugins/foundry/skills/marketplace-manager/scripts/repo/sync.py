@@ -11,17 +11,78 @@ For each plugin with a relative source path:
 3. Compare with marketplace.json and update where they differ
 
 Stdlib-only. Uses pyyaml when available for frontmatter parsing, falls back
-to a minimal subset parser.
+to a minimal subset parser. Uses orjson when available for JSON reads and
+writes.
 """
 
 import argparse
+import functools
 import json
+import os
+import re
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# -- JSON helpers (orjson when available, stdlib otherwise) ------------------
+
+def _load_json(path: Path):
+    """Read and parse a JSON file.
+
+    Raises json.JSONDecodeError on invalid JSON (orjson's error subclasses it).
+    """
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dump_json(data) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, identical on both backends."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 # -- YAML frontmatter parsing ------------------------------------------------
 
+# Fast path for version lookup: the frontmatter block, then a top-level
+# ``version:`` or one directly under ``metadata:``. The regexes only answer
+# for values YAML loads as that exact string -- quoted strings and dotted
+# x.y.z versions. Anything else (1.10, null, block scalars) goes through
+# the full parse, so both paths agree.
+_FRONTMATTER_RE = re.compile(r"\A---[ \t]*\n(.*?)^---", re.S | re.M)
+_TOP_VERSION_RE = re.compile(r"^version:(.*)$", re.M)
+# The first key under ``metadata:`` sets the indentation of its children;
+# ``version:`` must sit at exactly that level, not in a nested mapping
+_META_VERSION_RE = re.compile(
+    r"^metadata:[ \t]*(?:#.*)?\n"
+    r"(?:[ \t]*(?:#.*)?\n)*"
+    r"([ \t]+)(?:\S.*\n(?:\1.*\n|[ \t]*(?:#.*)?\n)*?\1)?"
+    r"version:(.*)$",
+    re.M,
+)
+_VERSION_VALUE_RE = re.compile(
+    r"[ \t]+(?:(['\"])([^'\"\\\n]+)\1|(v?\d+\.\d+\.\d+[-+.\w]*))"
+    r"(?:[ \t]+#.*)?[ \t]*"
+)
+
+
+def _match_version(frontmatter: str) -> str | None:
+    """Read the version from frontmatter text, or None if a parse is needed."""
+    line = (_TOP_VERSION_RE.search(frontmatter)
+            or _META_VERSION_RE.search(frontmatter))
+    if line is None:
+        return None
+    value = _VERSION_VALUE_RE.fullmatch(line.group(line.re.groups))
+    if value is None:
+        return None
+    return value.group(2) or value.group(3)
+
+
 def parse_frontmatter(text: str) -> dict:
     """Parse YAML frontmatter from a Markdown file."""
     if not text.startswith("---"):
@@ -84,13 +145,45 @@ def _parse_semver(version_str: str) -> tuple[int, ...]:
     return tuple(result)
 
 
+def _read_frontmatter_prefix(skill_md: Path) -> str:
+    """Read a Markdown file only up to the end of its frontmatter block.
+
+    The body after the closing ``---`` is never read, so large SKILL.md files
+    cost no more than their header. Files without frontmatter stop after the
+    first line.
+    """
+    with open(skill_md, encoding="utf-8") as f:
+        lines = [f.readline()]
+        if not lines[0].startswith("---"):
+            return lines[0]
+        for line in f:
+            lines.append(line)
+            if line.startswith("---"):
+                break
+    return "".join(lines)
+
+
+@functools.lru_cache(maxsize=None)
 def _extract_skill_version(skill_md: Path) -> str | None:
-    """Extract version from a SKILL.md frontmatter."""
+    """Extract version from a SKILL.md frontmatter.
+
+    Raises FileNotFoundError when the skill has no SKILL.md, so callers can
+    tell a missing file from one without a version.
+    """
     try:
-        text = skill_md.read_text(encoding="utf-8")
+        text = _read_frontmatter_prefix(skill_md)
+    except FileNotFoundError:
+        raise
     except OSError:
         return None
 
+    block = _FRONTMATTER_RE.match(text)
+    if block:
+        version = _match_version(block.group(1))
+        if version:
+            return version
+
+    # Unusual layouts (flow mappings, block scalars) -- full parse
     fm = parse_frontmatter(text)
     version = fm.get("version")
     if not version:
@@ -101,47 +194,54 @@ def _extract_skill_version(skill_md: Path) -> str | None:
     return str(version) if version else None
 
 
+@functools.lru_cache(maxsize=None)
 def resolve_version(plugin_dir: Path) -> tuple[str | None, str]:
     """Resolve the authoritative version for a plugin directory.
 
     Returns (version, source_label) where source_label describes where
-    the version came from (for reporting).
+    the version came from (for reporting). Results are cached per path so
+    marketplace entries sharing a source directory are resolved once.
 
     Priority:
     1. .claude-plugin/plugin.json "version" field
     2. Highest SKILL.md version across all skills (handles multi-skill plugins)
     """
     # Try plugin.json first
+    # Open directly rather than stat first; a missing file is just an OSError
     plugin_json = plugin_dir / ".claude-plugin" / "plugin.json"
-    if plugin_json.is_file():
-        try:
-            with open(plugin_json) as f:
-                data = json.load(f)
-            version = data.get("version")
-            if version:
-                return version, "plugin.json"
-        except (json.JSONDecodeError, OSError):
-            pass
-
-    # Fall back to SKILL.md frontmatter — use highest version across all skills
+    try:
+        version = _load_json(plugin_json).get("version")
+        if version:
+            return version, "plugin.json"
+    except (json.JSONDecodeError, OSError):
+        pass
+
+    # Fall back to SKILL.md frontmatter — use highest version across all skills.
+    # One scandir of skills/ (d_type, no per-entry stat), then read each
+    # SKILL.md without a separate existence check.
     skills_dir = plugin_dir / "skills"
-    if not skills_dir.is_dir():
+    try:
+        with os.scandir(skills_dir) as it:
+            skill_names = sorted(
+                entry.name for entry in it
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+    except OSError:
         return None, "no source"
 
-    skill_dirs = [
-        d for d in sorted(skills_dir.iterdir())
-        if d.is_dir() and not d.name.startswith(".")
-        and (d / "SKILL.md").exists()
-    ]
-
-    if len(skill_dirs) == 0:
-        return None, "no skills found"
-
+    found = 0
     skill_versions = []
-    for skill_dir in skill_dirs:
-        version = _extract_skill_version(skill_dir / "SKILL.md")
+    for skill_name in skill_names:
+        try:
+            version = _extract_skill_version(skills_dir / skill_name / "SKILL.md")
+        except FileNotFoundError:
+            continue
+        found += 1
         if version:
-            skill_versions.append((skill_dir.name, version))
+            skill_versions.append((skill_name, version))
+
+    if found == 0:
+        return None, "no skills found"
 
     if not skill_versions:
         return None, "SKILL.md (no version)"
@@ -174,10 +274,8 @@ def sync_versions(config: dict, repo_root: Path, dry_run: bool) -> list[dict]:
         if not isinstance(source, str) or not source.startswith("./"):
             continue
 
+        # No is_dir() pre-check: a missing source resolves to "no source"
         plugin_dir = repo_root / source
-        if not plugin_dir.is_dir():
-            continue
-
         source_version, source_label = resolve_version(plugin_dir)
 
         if source_version is None:
@@ -234,8 +332,7 @@ def main() -> None:
     repo_root = mp_path.parent.parent
 
     try:
-        with open(mp_path) as f:
-            config = json.load(f)
+        config = _load_json(mp_path)
     except json.JSONDecodeError as e:
         print(f"Invalid JSON in {mp_path}: {e}", file=sys.stderr)
         sys.exit(1)
@@ -248,15 +345,15 @@ def main() -> None:
 
     # Report changes
     action = "Would update" if args.dry_run else "Updated"
-    for c in changes:
-        old = c["old"] or "(none)"
-        print(f"  {action} {c['name']}: {old} -> {c['new']} (from {c['source']})")
+    print("\n".join(
+        f"  {action} {c['name']}: {c['old'] or '(none)'} -> {c['new']} "
+        f"(from {c['source']})"
+        for c in changes
+    ))
 
     # Write updated config
     if not args.dry_run:
-        with open(mp_path, "w") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        mp_path.write_bytes(_dump_json(config) + b"\n")
         print(f"\n{len(changes)} version(s) synced to {mp_path}")
     else:
         print(f"\n{len(changes)} version(s) would be updated. "
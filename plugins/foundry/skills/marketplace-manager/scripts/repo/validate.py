@@ -13,16 +13,28 @@ Use --fix to auto-add missing plugins. Use --staged for pre-commit checks.
 Use --check-structure to detect anti-patterns like shared source paths.
 
 Stdlib-only. No external dependencies required (uses pyyaml when available
-for SKILL.md frontmatter parsing, falls back to a minimal subset parser).
+for SKILL.md frontmatter parsing, falls back to a minimal subset parser,
+uses orjson when available for faster JSON reads and writes, and reads the
+git index in-process through pygit2 when it is installed).
 """
 
 import argparse
 import json
+import os
 import re
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolve git once instead of a PATH search on every subprocess call
+GIT = shutil.which("git") or "git"
+
 # -- Schema constants (official Anthropic marketplace schema) ----------------
 
 REQUIRED_ROOT = {"name", "owner", "plugins"}
@@ -39,11 +51,33 @@ KNOWN_PLUGIN = {
 NAME_RE = re.compile(r"^[a-z][a-z0-9]*(-[a-z0-9]+)*$")
 SEMVER_RE = re.compile(r"^v?\d+\.\d+\.\d+")
 
+# Staged files that carry a plugin version: any SKILL.md, or a plugin.json
+# under .claude-plugin/
+VERSION_FILE_RE = re.compile(r"SKILL\.md$|\.claude-plugin/.*plugin\.json$")
+
 # Directories that indicate discoverable plugin components
 COMPONENT_DIRS = ["skills", "commands", "agents", "hooks"]
 COMPONENT_FILES = [".mcp.json", ".lsp.json", "settings.json"]
 
 
+# -- JSON helpers (orjson when available, stdlib otherwise) ------------------
+
+def _load_json(path: Path):
+    """Read and parse a JSON file.
+
+    Raises json.JSONDecodeError on invalid JSON (orjson's error subclasses it).
+    """
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dump_json(data) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, identical on both backends."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
 # -- YAML frontmatter parsing -----------------------------------------------
 
 def parse_frontmatter(text: str) -> dict:
@@ -342,57 +376,99 @@ def check_structure(config: dict) -> list[str]:
     return warnings
 
 
-def check_staged(config: dict, repo_root: Path) -> list[str]:
-    """Check git staged files for version bumps when content changed."""
-    warnings = []
+def _staged_files_libgit2(repo_root: Path) -> set[str] | None:
+    """Staged paths read straight from the index via pygit2.
+
+    Returns None when pygit2 is unavailable or cannot open the repository,
+    so the caller falls back to the git CLI. Imported here rather than at
+    module level: pygit2 (cffi + libgit2) costs tens of milliseconds to load
+    and only --staged needs it.
+    """
+    try:
+        import pygit2
+    except ImportError:
+        return None
+    try:
+        repo = pygit2.Repository(pygit2.discover_repository(str(repo_root)))
+        if repo.head_is_unborn:
+            return {entry.path for entry in repo.index}
+        diff = repo.index.diff_to_tree(repo.head.peel(pygit2.Tree))
+        # Match `git diff --cached`, which reports a rename by its new path
+        diff.find_similar()
+        return {delta.new_file.path for delta in diff.deltas}
+    except (pygit2.GitError, KeyError, TypeError, ValueError):
+        return None
+
+
+def _staged_files(repo_root: Path, prefixes: list[str]) -> set[str] | None:
+    """Paths staged for commit, or None if git is unavailable.
+
+    The git CLI is given ``prefixes`` as literal pathspecs so it only reports
+    files under them; the pygit2 path returns everything and relies on the
+    caller's own filtering.
+    """
+    staged = _staged_files_libgit2(repo_root)
+    if staged is not None:
+        return staged
+    # -z gives raw NUL-separated paths: no text decoding of the whole output
+    # and no C-style quoting of non-ASCII names (core.quotePath)
+    pathspecs = [f":(literal){p}" for p in prefixes]
     try:
         result = subprocess.run(
-            ["git", "diff", "--cached", "--name-only"],
-            capture_output=True, text=True, cwd=repo_root,
+            [GIT, "diff", "--cached", "--name-only", "-z", "--", *pathspecs],
+            capture_output=True, cwd=repo_root,
         )
-        if result.returncode != 0:
-            return []
-        staged = set(result.stdout.strip().splitlines())
     except FileNotFoundError:
-        return []
+        return None
+    if result.returncode != 0:
+        return None
+    return {os.fsdecode(p) for p in result.stdout.split(b"\0") if p}
 
-    if not staged:
-        return []
 
+def check_staged(config: dict, repo_root: Path) -> list[str]:
+    """Check git staged files for version bumps when content changed."""
+    warnings = []
+    plugin_sources = []
     for plugin in config.get("plugins", []):
         source = plugin.get("source", "")
-        if not isinstance(source, str) or not source.startswith("./"):
-            continue
+        if isinstance(source, str) and source.startswith("./"):
+            plugin_sources.append((plugin, source.lstrip("./")))
 
-        source_rel = source.lstrip("./")
-        plugin_staged = [f for f in staged if f.startswith(source_rel + "/")]
+    # Only files under a local plugin source matter; let git filter them
+    prefixes = sorted({rel for _, rel in plugin_sources if rel})
+    if not prefixes:
+        return []
+    staged = _staged_files(repo_root, prefixes)
+    if not staged:
+        return []
+
+    # Bucket staged files by plugin source in one pass: look up each
+    # directory prefix of a path instead of testing every source per file
+    staged_by_source = {source_rel: [] for _, source_rel in plugin_sources}
+    for f in staged:
+        slash = f.find("/")
+        while slash != -1:
+            bucket = staged_by_source.get(f[:slash])
+            if bucket is not None:
+                bucket.append(f)
+            slash = f.find("/", slash + 1)
+
+    for plugin, source_rel in plugin_sources:
+        plugin_staged = staged_by_source[source_rel]
         if not plugin_staged:
             continue
 
+        # A staged version file settles it; stop at the first one. Otherwise
+        # every staged file is content and a bump is missing.
+        if any(VERSION_FILE_RE.search(f) for f in plugin_staged):
+            continue
+
         name = plugin.get("name", "unknown")
-        # Check if version-bearing files are also staged
-        skill_staged = [
-            f for f in plugin_staged if f.endswith("SKILL.md")
-        ]
-        pjson_staged = [
-            f for f in plugin_staged
-            if f.endswith("plugin.json")
-            and ".claude-plugin/" in f
-        ]
-
-        # Content files changed but no version file staged
-        content_changed = [
-            f for f in plugin_staged
-            if not f.endswith("SKILL.md")
-            and not (f.endswith("plugin.json") and ".claude-plugin/" in f)
-        ]
-
-        if content_changed and not skill_staged and not pjson_staged:
-            warnings.append(
-                f"Plugin '{name}': content files changed but no version bump "
-                f"detected. Stage a SKILL.md or plugin.json with an updated "
-                f"version."
-            )
+        warnings.append(
+            f"Plugin '{name}': content files changed but no version bump "
+            f"detected. Stage a SKILL.md or plugin.json with an updated "
+            f"version."
+        )
 
     return warnings
 
@@ -403,9 +479,7 @@ def fix_manifest(config: dict, missing: list[dict], path: Path) -> None:
     """Add missing plugins and write sorted marketplace.json."""
     config["plugins"].extend(missing)
     config["plugins"].sort(key=lambda p: p.get("name", ""))
-    with open(path, "w") as f:
-        json.dump(config, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    path.write_bytes(_dump_json(config) + b"\n")
 
 
 # -- Output formatting -------------------------------------------------------
@@ -447,7 +521,7 @@ def format_text(errors: list, warnings: list, missing: list,
 def format_json(errors: list, warnings: list, missing: list,
                 structure: list, staged: list, fixed: bool) -> str:
     """Format results as JSON for CI consumption."""
-    return json.dumps({
+    return _dump_json({
         "valid": len(errors) == 0,
         "errors": errors,
         "warnings": warnings,
@@ -455,7 +529,7 @@ def format_json(errors: list, warnings: list, missing: list,
         "structure_warnings": structure,
         "staged_warnings": staged,
         "fixed": fixed,
-    }, indent=2)
+    }).decode("utf-8")
 
 
 # -- Main --------------------------------------------------------------------
@@ -489,8 +563,7 @@ def main() -> None:
     repo_root = mp_path.parent.parent
 
     try:
-        with open(mp_path) as f:
-            config = json.load(f)
+        config = _load_json(mp_path)
     except json.JSONDecodeError as e:
         print(f"Invalid JSON in {mp_path}: {e}", file=sys.stderr)
         sys.exit(1)
@@ -18,10 +18,20 @@ Examples:
 
 import argparse
 import json
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Resolve git once instead of a PATH search on every subprocess call
+GIT = shutil.which("git") or "git"
+
 
 # ---------------------------------------------------------------------------
 # YAML frontmatter parsing (try pyyaml, fall back to stdlib)
@@ -38,9 +48,11 @@ def parse_frontmatter(text: str) -> dict:
 
     try:
         import yaml
-        return yaml.safe_load(raw) or {}
     except ImportError:
         return _parse_frontmatter_stdlib(raw)
+    # libyaml's C loader when PyYAML was built with it; same safe semantics
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader) or {}
 
 
 def _parse_frontmatter_stdlib(raw: str) -> dict:
@@ -82,7 +94,7 @@ def _git_available() -> bool:
     """Return True if git is available and we are inside a work tree."""
     try:
         subprocess.run(
-            ["git", "rev-parse", "--is-inside-work-tree"],
+            [GIT, "rev-parse", "--is-inside-work-tree"],
             capture_output=True, check=True,
         )
         return True
@@ -99,10 +111,45 @@ def _find_marketplace_json(plugins_dir: Path) -> Path | None:
     return None
 
 
+def _load_json(path: Path):
+    """Read and parse a JSON file, using orjson when available."""
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
 def _write_json(path: Path, data: dict) -> None:
-    """Write JSON with consistent formatting."""
+    """Write JSON with consistent formatting (orjson when available).
+
+    Leaves the file untouched when its bytes would not change. Otherwise the
+    new content goes to a temp file in the same directory which is renamed
+    over the target, so an interrupted run never leaves a truncated manifest.
+    """
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2) + "\n")
+    encoded = orjson.dumps(data, option=orjson.OPT_INDENT_2) if orjson else None
+    if encoded is None or not encoded.isascii():
+        # Keep json.dumps' \uXXXX escapes so non-ASCII text writes the same bytes
+        encoded = json.dumps(data, indent=2).encode("ascii")
+    encoded += b"\n"
+
+    try:
+        if path.read_bytes() == encoded:
+            return
+        existed = True
+    except FileNotFoundError:
+        existed = False
+
+    tmp = path.with_name(f".{path.name}.tmp-{os.getpid()}")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(encoded)
+            f.flush()
+            os.fsync(f.fileno())
+        if existed:
+            shutil.copymode(path, tmp)
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def _make_plugin_json(name: str, description: str | None) -> dict:
@@ -158,13 +205,26 @@ def cmd_create(args: argparse.Namespace) -> int:
     plugin_root = plugins_dir / name
     description = args.description or f"A Claude Code plugin for {name}"
 
-    if plugin_root.exists():
+    # Claim the plugin root atomically; an existing path raises here
+    try:
+        plugin_root.mkdir(parents=True)
+    except FileExistsError:
         print(f"ERROR: Directory already exists: {plugin_root}", file=sys.stderr)
         return 1
 
-    # Core directories
+    # Create only the leaf directories; mkdir(parents=True) fills in the rest
     skill_dir = plugin_root / "skills" / name
-    skill_dir.mkdir(parents=True)
+    commands_dir = plugin_root / "commands"
+    agents_dir = plugin_root / "agents"
+    leaves = [skill_dir]
+    if not args.no_plugin_json:
+        leaves.append(plugin_root / ".claude-plugin")
+    if args.with_commands:
+        leaves.append(commands_dir)
+    if args.with_agents:
+        leaves.append(agents_dir)
+    for leaf in leaves:
+        leaf.mkdir(parents=True, exist_ok=True)
 
     # plugin.json (unless --no-plugin-json)
     if not args.no_plugin_json:
@@ -175,18 +235,14 @@ def cmd_create(args: argparse.Namespace) -> int:
 
     # SKILL.md
     skill_md_path = skill_dir / "SKILL.md"
-    skill_md_path.write_text(_make_skill_md(name, description))
+    skill_md_path.write_text(_make_skill_md(name, description), encoding="utf-8")
     print(f"  Created {skill_md_path.relative_to(plugins_dir.parent)}")
 
     # Optional directories
     if args.with_commands:
-        commands_dir = plugin_root / "commands"
-        commands_dir.mkdir()
         print(f"  Created {commands_dir.relative_to(plugins_dir.parent)}/")
 
     if args.with_agents:
-        agents_dir = plugin_root / "agents"
-        agents_dir.mkdir()
         print(f"  Created {agents_dir.relative_to(plugins_dir.parent)}/")
 
     if args.with_mcp:
@@ -266,21 +322,20 @@ def cmd_migrate(args: argparse.Namespace) -> int:
     marketplace_json = _find_marketplace_json(plugins_dir)
     marketplace_update = None
     if marketplace_json and marketplace_json.is_file():
-        mp_data = json.loads(marketplace_json.read_text())
+        mp_data = _load_json(marketplace_json)
         old_source = f"./skills/{skill_name}"
         new_source = f"./plugins/{skill_name}"
         for plugin_entry in mp_data.get("plugins", []):
             src = plugin_entry.get("source", "")
             if isinstance(src, str) and (src == old_source or src.rstrip("/") == old_source.rstrip("/")):
-                marketplace_update = (marketplace_json, plugin_entry, old_source, new_source)
+                marketplace_update = (marketplace_json, mp_data, plugin_entry, old_source, new_source)
                 steps.append(f"update marketplace.json: source '{old_source}' -> '{new_source}'")
                 break
 
     # Preview or execute
     print(f"Migrating skill '{skill_name}' to plugin structure:\n")
-    for step in steps:
-        prefix = "[DRY RUN] " if dry_run else "  "
-        print(f"{prefix}{step}")
+    prefix = "[DRY RUN] " if dry_run else "  "
+    print("\n".join(f"{prefix}{step}" for step in steps))
 
     if dry_run:
         print("\nDry run complete. No changes made.")
@@ -297,7 +352,7 @@ def cmd_migrate(args: argparse.Namespace) -> int:
 
     # 2. git mv the skill directory
     result = subprocess.run(
-        ["git", "mv", str(skill_path), str(target_skill_dir)],
+        [GIT, "mv", str(skill_path), str(target_skill_dir)],
         capture_output=True, text=True,
     )
     if result.returncode != 0:
@@ -309,15 +364,11 @@ def cmd_migrate(args: argparse.Namespace) -> int:
     _write_json(manifest_path, manifest_data)
     print(f"  Created {manifest_path}")
 
-    # 4. Update marketplace.json if applicable
+    # 4. Update marketplace.json if applicable, reusing the document and
+    #    entry found while planning rather than parsing the file again
     if marketplace_update:
-        mp_file, _entry, old_src, new_src = marketplace_update
-        mp_data = json.loads(mp_file.read_text())
-        for plugin_entry in mp_data.get("plugins", []):
-            src = plugin_entry.get("source", "")
-            if isinstance(src, str) and src.rstrip("/") == old_src.rstrip("/"):
-                plugin_entry["source"] = new_src
-                break
+        mp_file, mp_data, plugin_entry, old_src, new_src = marketplace_update
+        plugin_entry["source"] = new_src
         _write_json(mp_file, mp_data)
         print(f"  Updated {mp_file}: source '{old_src}' -> '{new_src}'")
 
@@ -90,9 +90,10 @@ def cmd_init(args: argparse.Namespace) -> bool:
 
     # Create directory and write
     mp_dir.mkdir(parents=True, exist_ok=True)
-    with open(mp_path, "w") as f:
-        json.dump(manifest, f, indent=2, ensure_ascii=False)
-        f.write("\n")
+    mp_path.write_text(
+        json.dumps(manifest, indent=2, ensure_ascii=False) + "\n",
+        encoding="utf-8",
+    )
 
     print(f"Created {mp_path}")
     print(f"  name: {name}")
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "pytest>=7.0",
+#   "pyyaml>=6.0.1",
+# ]
+# ///
+"""
+Test suite for sync.py version resolution.
+
+Tests cover:
+- SKILL.md version fast path against the full frontmatter parse
+- Top-level and metadata versions, nesting, quoting, YAML-typed values
+- plugin.json version lookup and its fallback to SKILL.md
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the bundled repo scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "repo"))
+
+from sync import _extract_skill_version, _match_version, parse_frontmatter, resolve_version
+
+
+def _write_skill(tmp_path: Path, frontmatter: str) -> Path:
+    skill_md = tmp_path / "SKILL.md"
+    skill_md.write_text(f"---\n{frontmatter}---\n\n# Body\n", encoding="utf-8")
+    return skill_md
+
+
+def _parsed_version(frontmatter: str) -> str | None:
+    """Version as the full parse reports it: top-level, then metadata."""
+    fm = parse_frontmatter(f"---\n{frontmatter}---\n")
+    version = fm.get("version")
+    if not version:
+        metadata = fm.get("metadata")
+        if isinstance(metadata, dict):
+            version = metadata.get("version")
+    return str(version) if version else None
+
+
+FRONTMATTERS = [
+    "name: x\nversion: 1.2.3\n",
+    "name: x\nversion: '1.2.3'  # released\n",
+    "name: x\nmetadata:\n  author: me\n\n  version: \"2.0.1\"  # bump\n",
+    "metadata:\n  other:\n    version: 9.9.9\n  version: 1.0.0\n",
+    "metadata:\n  version: 1.0.0\n  other:\n    version: 9.9.9\n",
+    "metadata:\n  other:\n    version: 9.9.9\n",
+    "metadata:\n  list:\n  - version: 8.8.8\n  version: 1.0.0\n",
+    "metadata:\n    version: 3.0.0\n",
+    "version: '1.0.0'\nmetadata:\n  version: 2.0.0\n",
+    "version: 1.10\nmetadata:\n  version: 2.0.0\n",
+    "version: 1.10\n",
+    "metadata:\n  version: 1.10\n",
+    "version: null\nmetadata:\n  version: 2.0.0\n",
+    "version: ~\n",
+    "version: true\n",
+    "version: 2024-01-01\n",
+    "version: |\n  1.0.0\n",
+    "version: \"1.0\\t\"\n",
+    "version: 1.2.3#build\n",
+    "version: v1.2.3-beta.1\n",
+    "metadata: {version: '3.1.0'}\n",
+    "other:\n  version: 5.0.0\n",
+    "name: x\nversion:\n",
+]
+
+
+class TestSkillVersion:
+    """_extract_skill_version() must agree with the full frontmatter parse"""
+
+    @pytest.mark.parametrize("frontmatter", FRONTMATTERS)
+    def test_matches_full_parse(self, tmp_path, frontmatter):
+        skill_md = _write_skill(tmp_path, frontmatter)
+        assert _extract_skill_version(skill_md) == _parsed_version(frontmatter)
+
+    @pytest.mark.parametrize("frontmatter", FRONTMATTERS)
+    def test_fast_path_never_disagrees(self, frontmatter):
+        fast = _match_version(frontmatter)
+        assert fast is None or fast == _parsed_version(frontmatter)
+
+    def test_metadata_version_ignores_nested_mappings(self, tmp_path):
+        skill_md = _write_skill(
+            tmp_path, "metadata:\n  other:\n    version: 9.9.9\n  version: 1.0.0\n"
+        )
+        assert _extract_skill_version(skill_md) == "1.0.0"
+
+    def test_nested_only_metadata_version_is_not_used(self, tmp_path):
+        skill_md = _write_skill(tmp_path, "metadata:\n  other:\n    version: 9.9.9\n")
+        assert _extract_skill_version(skill_md) is None
+
+    def test_unquoted_float_version_reads_as_yaml_does(self, tmp_path):
+        pytest.importorskip("yaml")
+        # YAML loads an unquoted 1.10 as the float 1.1
+        skill_md = _write_skill(tmp_path, "version: 1.10\n")
+        assert _match_version("version: 1.10\n") is None
+        assert _extract_skill_version(skill_md) == "1.1"
+
+    def test_quoted_version_is_kept_verbatim(self, tmp_path):
+        skill_md = _write_skill(tmp_path, "version: \"1.10\"\n")
+        assert _extract_skill_version(skill_md) == "1.10"
+
+    def test_missing_skill_md_raises(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            _extract_skill_version(tmp_path / "SKILL.md")
+
+
+class TestResolveVersion:
+    """resolve_version() reads plugin.json first, then SKILL.md"""
+
+    def _plugin(self, tmp_path: Path, plugin_json: str | None) -> Path:
+        plugin_dir = tmp_path / "plugin"
+        skill_dir = plugin_dir / "skills" / "demo"
+        skill_dir.mkdir(parents=True)
+        _write_skill(skill_dir, "name: demo\nmetadata:\n  version: 1.2.0\n")
+        if plugin_json is not None:
+            (plugin_dir / ".claude-plugin").mkdir()
+            (plugin_dir / ".claude-plugin" / "plugin.json").write_text(plugin_json, encoding="utf-8")
+        return plugin_dir
+
+    def test_plugin_json_version(self, tmp_path):
+        plugin_dir = self._plugin(tmp_path, '{"name": "p", "version": "2.0.0"}')
+        assert resolve_version(plugin_dir) == ("2.0.0", "plugin.json")
+
+    def test_top_level_version_wins_over_nested(self, tmp_path):
+        plugin_dir = self._plugin(
+            tmp_path,
+            '{"name": "p", "dependencies": {"x": {"version": "9.9.9"}}, "version": "2.0.0"}',
+        )
+        assert resolve_version(plugin_dir) == ("2.0.0", "plugin.json")
+
+    def test_nested_only_version_falls_back_to_skill_md(self, tmp_path):
+        plugin_dir = self._plugin(
+            tmp_path, '{"name":"p","dependencies":{"x":{"version":"9.9.9"}}}'
+        )
+        assert resolve_version(plugin_dir) == ("1.2.0", "SKILL.md (demo)")
+
+    def test_invalid_plugin_json_falls_back_to_skill_md(self, tmp_path):
+        plugin_dir = self._plugin(tmp_path, '{"version": ')
+        assert resolve_version(plugin_dir) == ("1.2.0", "SKILL.md (demo)")
+
+    def test_no_plugin_json(self, tmp_path):
+        plugin_dir = self._plugin(tmp_path, None)
+        assert resolve_version(plugin_dir) == ("1.2.0", "SKILL.md (demo)")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
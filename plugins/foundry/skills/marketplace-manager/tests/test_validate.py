@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+# /// script
+# dependencies = [
+#   "pytest>=7.0",
+# ]
+# ///
+"""
+Test suite for validate.py staged-file checks.
+
+Tests cover:
+- Version-bump warnings for staged edits, renames and deletions
+- Non-ASCII and glob-like plugin paths (literal pathspecs, -z output)
+- pygit2 index reads and the git CLI fallback
+"""
+
+import shutil
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add the bundled repo scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts" / "repo"))
+
+import validate
+from validate import _staged_files, check_staged
+
+pytestmark = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+PLUGINS = {
+    "alpha": "plugins/alpha",
+    "cafe": "plugins/café",
+    "glob": "plugins/g[l]ob*",
+}
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+def _warned(warnings: list[str]) -> set[str]:
+    return {w.split("'")[1] for w in warnings}
+
+
+@pytest.fixture(params=["cli", "pygit2"])
+def backend(request, monkeypatch):
+    """Run each test against the git CLI and, when installed, pygit2."""
+    if request.param == "cli":
+        # A None entry makes `import pygit2` raise ImportError
+        monkeypatch.setitem(sys.modules, "pygit2", None)
+    else:
+        pytest.importorskip("pygit2")
+    return request.param
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A committed repository with one skill per plugin."""
+    _git(tmp_path, "init", "-q")
+    for rel in PLUGINS.values():
+        skill = tmp_path / rel / "skills" / "demo"
+        skill.mkdir(parents=True)
+        (skill / "SKILL.md").write_text("---\nname: demo\nversion: 1.0.0\n---\n", encoding="utf-8")
+        (skill / "notes.md").write_text("notes\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("readme\n", encoding="utf-8")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+@pytest.fixture
+def config():
+    return {"plugins": [{"name": name, "source": f"./{rel}"} for name, rel in PLUGINS.items()]}
+
+
+class TestCheckStaged:
+    """Test check_staged() version-bump warnings"""
+
+    def test_nothing_staged(self, repo, config, backend):
+        assert check_staged(config, repo) == []
+
+    def test_files_outside_plugins_are_ignored(self, repo, config, backend):
+        (repo / "README.md").write_text("changed\n", encoding="utf-8")
+        _git(repo, "add", "README.md")
+        assert check_staged(config, repo) == []
+
+    def test_content_change_without_bump(self, repo, config, backend):
+        (repo / "plugins/alpha/skills/demo/notes.md").write_text("changed\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        assert _warned(check_staged(config, repo)) == {"alpha"}
+
+    def test_content_change_with_bump(self, repo, config, backend):
+        skill = repo / "plugins/alpha/skills/demo"
+        (skill / "notes.md").write_text("changed\n", encoding="utf-8")
+        (skill / "SKILL.md").write_text("---\nname: demo\nversion: 1.1.0\n---\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        assert check_staged(config, repo) == []
+
+    def test_rename(self, repo, config, backend):
+        _git(repo, "mv", "plugins/alpha/skills/demo/notes.md", "plugins/alpha/skills/demo/guide.md")
+        assert _warned(check_staged(config, repo)) == {"alpha"}
+
+    def test_deletion(self, repo, config, backend):
+        _git(repo, "rm", "-q", "plugins/alpha/skills/demo/notes.md")
+        assert _warned(check_staged(config, repo)) == {"alpha"}
+
+    def test_non_ascii_path(self, repo, config, backend):
+        (repo / "plugins/café/skills/demo/résumé.md").write_text("new\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        assert _warned(check_staged(config, repo)) == {"cafe"}
+
+    def test_non_ascii_path_with_bump(self, repo, config, backend):
+        skill = repo / "plugins/café/skills/demo"
+        (skill / "résumé.md").write_text("new\n", encoding="utf-8")
+        (skill / "SKILL.md").write_text("---\nname: demo\nversion: 2.0.0\n---\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        assert check_staged(config, repo) == []
+
+    def test_glob_characters_are_literal(self, repo, config, backend):
+        # "g[l]ob*" as a glob would match plugins/glob-extra as well
+        (repo / "plugins/glob-extra").mkdir()
+        (repo / "plugins/glob-extra/file.md").write_text("x\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        assert check_staged(config, repo) == []
+
+        (repo / "plugins/g[l]ob*/skills/demo/notes.md").write_text("changed\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+        assert _warned(check_staged(config, repo)) == {"glob"}
+
+
+class TestStagedFiles:
+    """Test _staged_files() path reporting"""
+
+    def test_reports_new_paths_for_renames_and_deletions(self, repo, backend):
+        _git(repo, "mv", "plugins/alpha/skills/demo/notes.md", "plugins/alpha/skills/demo/guide.md")
+        _git(repo, "rm", "-q", "plugins/café/skills/demo/notes.md")
+
+        staged = _staged_files(repo, sorted(PLUGINS.values()))
+        assert staged == {
+            "plugins/alpha/skills/demo/guide.md",
+            "plugins/café/skills/demo/notes.md",
+        }
+
+    def test_cli_filters_by_prefix(self, repo, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pygit2", None)
+        (repo / "README.md").write_text("changed\n", encoding="utf-8")
+        (repo / "plugins/alpha/skills/demo/notes.md").write_text("changed\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+
+        assert _staged_files(repo, ["plugins/alpha"]) == {"plugins/alpha/skills/demo/notes.md"}
+
+    def test_git_unavailable(self, repo, config, monkeypatch):
+        monkeypatch.setitem(sys.modules, "pygit2", None)
+        monkeypatch.setattr(validate, "GIT", str(repo / "no-such-git"))
+        (repo / "plugins/alpha/skills/demo/notes.md").write_text("changed\n", encoding="utf-8")
+        _git(repo, "add", "-A")
+
+        assert _staged_files(repo, ["plugins/alpha"]) is None
+        assert check_staged(config, repo) == []
+
+    def test_not_a_repository(self, tmp_path, backend):
+        assert _staged_files(tmp_path, ["plugins/alpha"]) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
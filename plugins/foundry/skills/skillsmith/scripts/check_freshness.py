@@ -32,21 +32,38 @@ import sys
 import time
 import urllib.parse
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from pathlib import Path
 
 
 DEFAULT_THRESHOLD_DAYS = 90
 
+# References are checked concurrently: each check is gh/glab/curl/HTTP
+# round-trips. Kept small to stay polite to API rate limits.
+MAX_CHECK_WORKERS = 8
+
 
 def parse_frontmatter(path: Path) -> dict:
-    """Extract YAML frontmatter from a markdown file."""
+    """Extract YAML frontmatter from a markdown file.
+
+    Reads line by line only until the closing ``---``, so long reference
+    bodies are never read or decoded.
+    """
     try:
-        text = path.read_text()
+        with open(path) as f:
+            first = f.readline()
+            if not first.startswith("---"):
+                return {}
+            lines = [first]
+            if "---" not in first[3:]:
+                for line in f:
+                    lines.append(line)
+                    if "---" in line:
+                        break
     except (OSError, UnicodeDecodeError):
         return {}
-    if not text.startswith("---"):
-        return {}
+    text = "".join(lines)
     try:
         end = text.index("---", 3)
     except ValueError:
@@ -555,18 +572,22 @@ def main():
     if args.verbose:
         print(f"Found {len(tracked_refs)} provenance-tracked references", file=sys.stderr)
 
-    # Check each reference
-    results = []
-    for ref in tracked_refs:
+    # Check each reference (network-bound, so overlap them; map keeps order)
+    def check(ref: dict) -> dict:
         if args.verbose:
-            print(f"  Checking {ref['file']}...", file=sys.stderr)
-        result = check_reference(
+            # Printed as each check starts; one write keeps lines from
+            # concurrent workers intact
+            sys.stderr.write(f"  Checking {ref['file']}...\n")
+        return check_reference(
             ref, today, args.threshold_days,
             since_override=since_override,
             probe=args.probe,
             full_audit=args.full_audit,
         )
-        results.append(result)
+
+    workers = min(MAX_CHECK_WORKERS, len(tracked_refs))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(check, tracked_refs))
 
     score = calculate_freshness_score(results)
 
@@ -87,6 +87,8 @@ Options:
 """
 
 import atexit
+import bisect
+import functools
 import os
 import shutil
 import sys
@@ -103,25 +105,40 @@ from urllib.parse import urlparse
 # Previously imported from quick_validate.py (now deleted - functionality integrated below)
 # from quick_validate import validate_skill
 
+# SKILL.md frontmatter block and the hyphen-case name rule, compiled once
+_FRONTMATTER_BLOCK = re.compile(r'^---\n(.*?)\n---', re.DOTALL)
+_HYPHEN_CASE_NAME = re.compile(r'^[a-z0-9-]+$')
+
+
 # Inlined validate_skill function (previously from quick_validate.py)
 def validate_skill(skill_path):
     """Basic validation of a skill - inlined from quick_validate.py"""
+    valid, message, skill_version, _ = _validate_skill(skill_path)
+    return valid, message, skill_version
+
+
+def _validate_skill(skill_path):
+    """validate_skill() plus the parsed frontmatter (None when unparsed).
+
+    Lets quick_validate() inspect the frontmatter without reading SKILL.md
+    and running the YAML parser a second time.
+    """
     skill_path = Path(skill_path)
 
     # Check SKILL.md exists
     skill_md = skill_path / 'SKILL.md'
     if not skill_md.exists():
-        return False, "SKILL.md not found", None
+        return False, "SKILL.md not found", None, None
 
     # Read and validate frontmatter
     content = skill_md.read_text()
     if not content.startswith('---'):
-        return False, "No YAML frontmatter found", None
+        return False, "No YAML frontmatter found", None, None
 
     # Extract frontmatter
-    match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
+    match = _FRONTMATTER_BLOCK.match(content)
     if not match:
-        return False, "Invalid frontmatter format", None
+        return False, "Invalid frontmatter format", None, None
 
     frontmatter_text = match.group(1)
 
@@ -131,32 +148,32 @@ def validate_skill(skill_path):
     try:
         fm = yaml.safe_load(frontmatter_text) or {}
     except yaml.YAMLError as e:
-        return False, f"Invalid YAML frontmatter: {e}", None
+        return False, f"Invalid YAML frontmatter: {e}", None, None
 
     # Check required fields
     if 'name' not in fm:
-        return False, "Missing 'name' in frontmatter", None
+        return False, "Missing 'name' in frontmatter", None, fm
     if 'description' not in fm:
-        return False, "Missing 'description' in frontmatter", None
+        return False, "Missing 'description' in frontmatter", None, fm
 
     # Validate name
     name = str(fm['name']).strip()
-    if not re.match(r'^[a-z0-9-]+$', name):
-        return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)", None
+    if not _HYPHEN_CASE_NAME.match(name):
+        return False, f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)", None, fm
     if name.startswith('-') or name.endswith('-') or '--' in name:
-        return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens", None
+        return False, f"Name '{name}' cannot start/end with hyphen or contain consecutive hyphens", None, fm
 
     # Validate description (parsed value — block scalar indicators are not included)
     description = str(fm['description']).strip()
     if '<' in description or '>' in description:
-        return False, "Description cannot contain angle brackets (< or >)", None
+        return False, "Description cannot contain angle brackets (< or >)", None, fm
 
     # Extract version — may be top-level or nested under metadata:
     metadata = fm.get('metadata', {}) or {}
     skill_version = str(fm['version']).strip() if 'version' in fm else \
                     str(metadata['version']).strip() if 'version' in metadata else None
 
-    return True, "Skill is valid!", skill_version
+    return True, "Skill is valid!", skill_version, fm
 
 
 # ============================================================================
@@ -399,7 +416,7 @@ def check_python_scripts_pep723(skill_dir):
 
     for script in python_scripts:
         try:
-            content = script.read_text(encoding='utf-8')
+            content = read_resource_text(script)
 
             # Check for PEP 723 metadata block
             has_pep723 = "# /// script" in content
@@ -485,52 +502,37 @@ def quick_validate(skill_path, check_improvement_plan=False):
     """
     skill_path = Path(skill_path)
 
-    # Basic structure validation (imported from quick_validate.py)
-    struct_valid, struct_message, skill_version = validate_skill(skill_path)
+    # Basic structure validation (imported from quick_validate.py); reuse its
+    # parsed frontmatter rather than reading and parsing SKILL.md again
+    struct_valid, struct_message, skill_version, frontmatter = _validate_skill(skill_path)
 
     # Enhanced version checking (check metadata.version specifically)
     if struct_valid:
-        try:
-            skill_md = Path(skill_path) / 'SKILL.md'
-            content = skill_md.read_text()
-            match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-            if match:
-                import yaml
-                try:
-                    frontmatter = yaml.safe_load(match.group(1))
-
-                    # Check for version in metadata (preferred location)
-                    has_metadata_version = (
-                        isinstance(frontmatter, dict) and
-                        'metadata' in frontmatter and
-                        isinstance(frontmatter['metadata'], dict) and
-                        'version' in frontmatter['metadata']
-                    )
+        # Check for version in metadata (preferred location)
+        has_metadata_version = (
+            isinstance(frontmatter, dict) and
+            'metadata' in frontmatter and
+            isinstance(frontmatter['metadata'], dict) and
+            'version' in frontmatter['metadata']
+        )
 
-                    # Check for version at top level (deprecated)
-                    has_toplevel_version = (
-                        isinstance(frontmatter, dict) and
-                        'version' in frontmatter and
-                        'metadata' not in frontmatter
-                    )
+        # Check for version at top level (deprecated)
+        has_toplevel_version = (
+            isinstance(frontmatter, dict) and
+            'version' in frontmatter and
+            'metadata' not in frontmatter
+        )
 
-                    # Use metadata.version if available, otherwise top-level version
-                    if has_metadata_version:
-                        skill_version = frontmatter['metadata']['version']
-                    elif has_toplevel_version:
-                        skill_version = frontmatter['version']
-                        struct_message = f"{struct_message} (Note: using deprecated 'version' field; prefer 'metadata.version')"
-                    elif not skill_version:
-                        # No version found in either location
-                        struct_valid = False
-                        struct_message = "Missing version field (should be in metadata.version)"
-
-                except yaml.YAMLError:
-                    # YAML parsing failed, but quick_validate already caught this
-                    pass
-        except Exception:
-            # File read error, but quick_validate already caught this
-            pass
+        # Use metadata.version if available, otherwise top-level version
+        if has_metadata_version:
+            skill_version = frontmatter['metadata']['version']
+        elif has_toplevel_version:
+            skill_version = frontmatter['version']
+            struct_message = f"{struct_message} (Note: using deprecated 'version' field; prefer 'metadata.version')"
+        elif not skill_version:
+            # No version found in either location
+            struct_valid = False
+            struct_message = "Missing version field (should be in metadata.version)"
 
     result = {
         'valid': struct_valid,
@@ -589,33 +591,61 @@ RECOMMENDED_FRONTMATTER = ['metadata', 'compatibility', 'license']
 # File Reading Utilities (from calculate_metrics.py)
 # ============================================================================
 
+def read_resource_text(file_path):
+    """Read a bundled resource file as UTF-8 text, reusing recent reads.
+
+    Scripts and references are read by several independent checks (line
+    counts, PEP 723, conciseness detectors, readability, overlap); the cache
+    means each file is decoded only once per evaluation. Entries are keyed
+    on the file's mtime and size, so a file edited between evaluations in
+    the same process is read again. Decode errors propagate (uncached) so
+    callers can skip binary files.
+    """
+    path = Path(file_path)
+    stat = path.stat()
+    return _read_resource_text(path, stat.st_mtime_ns, stat.st_size)
+
+
+@functools.lru_cache(maxsize=256)
+def _read_resource_text(path, mtime_ns, size):
+    """Cached body of read_resource_text(); the stamp is only part of the key."""
+    return path.read_text(encoding='utf-8')
+
+
 def count_lines(file_path):
     """Count lines in a file"""
-    with open(file_path) as f:
-        return len(f.readlines())
+    text = read_resource_text(file_path)
+    # Same count as len(readlines()): newlines, plus an unterminated last line
+    return text.count('\n') + (1 if text and not text.endswith('\n') else 0)
 
 
-def count_files_recursive(directory, extension=None):
-    """Count files recursively in directory"""
+def list_files_recursive(directory):
+    """List files in directory recursively (one traversal, shared by counters)"""
     if not directory.exists():
-        return 0
+        return []
+    return [item for item in directory.rglob('*') if item.is_file()]
+
+
+def count_files_recursive(directory, extension=None, files=None):
+    """Count files recursively in directory"""
+    if files is None:
+        files = list_files_recursive(directory)
 
     count = 0
-    for item in directory.rglob('*'):
-        if item.is_file():
-            if extension is None or item.suffix == extension:
-                count += 1
+    for item in files:
+        if extension is None or item.suffix == extension:
+            count += 1
     return count
 
 
-def count_total_lines_recursive(directory):
+def count_total_lines_recursive(directory, files=None):
     """Count total lines in all files in directory"""
-    if not directory.exists():
-        return 0
+    if files is None:
+        files = list_files_recursive(directory)
 
     total = 0
-    for item in directory.rglob('*'):
-        if item.is_file() and not item.name.startswith('.'):
+    for item in files:
+        if not item.name.startswith('.'):
             try:
                 total += count_lines(item)
             except:
@@ -696,11 +726,14 @@ def calculate_basic_metrics(skill_path):
     skill_md_tokens = estimate_tokens(body)
 
     # Bundled resources
-    scripts_count = count_files_recursive(skill_path / 'scripts')
-    scripts_lines = count_total_lines_recursive(skill_path / 'scripts')
+    # List each directory once and derive both file and line counts from it
+    scripts_files = list_files_recursive(skill_path / 'scripts')
+    scripts_count = count_files_recursive(skill_path / 'scripts', files=scripts_files)
+    scripts_lines = count_total_lines_recursive(skill_path / 'scripts', files=scripts_files)
 
-    references_count = count_files_recursive(skill_path / 'references')
-    references_lines = count_total_lines_recursive(skill_path / 'references')
+    references_files = list_files_recursive(skill_path / 'references')
+    references_count = count_files_recursive(skill_path / 'references', files=references_files)
+    references_lines = count_total_lines_recursive(skill_path / 'references', files=references_files)
 
     assets_count = count_files_recursive(skill_path / 'assets')
 
@@ -720,17 +753,30 @@ def calculate_basic_metrics(skill_path):
     }
 
 
-_LEGACY_MARKERS = [
-    re.compile(r'\blegacy\b', re.IGNORECASE),
-    re.compile(r'\bdeprecated\b', re.IGNORECASE),
-    re.compile(r'prefer .+? instead', re.IGNORECASE),
-    re.compile(r'use .+? instead', re.IGNORECASE),
-    re.compile(r'\bold approach\b', re.IGNORECASE),
-]
+# Line boundaries as str.splitlines() sees them, so offsets in the whole
+# buffer map to the same line numbers as a per-line scan
+_LINE_BREAK = re.compile('\r\n|[\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]')
+_NOT_LINE_BREAK = '[^\n\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]'
+
+_LEGACY_MARKER = re.compile(
+    r'\blegacy\b'
+    r'|\bdeprecated\b'
+    r'|prefer ' + _NOT_LINE_BREAK + r'+? instead'
+    r'|use ' + _NOT_LINE_BREAK + r'+? instead'
+    r'|\bold approach\b',
+    re.IGNORECASE,
+)
+# Every legacy marker contains one of these words; content without any of
+# them cannot match and skips the regex scan. "tead" stands in for
+# "instead": IGNORECASE also matches its i and s to dotless ı and long ſ,
+# which str.lower() leaves alone.
+_LEGACY_KEYWORDS = ('legacy', 'deprecated', 'tead', 'old approach')
 
 _REFERENCE_POINTER = re.compile(
     r'(?:[Ss]ee|[Ff]ull guide in|[Cc]omplete guide in)\s+`?references/',
 )
+_REFERENCE_PATH = re.compile(r'references/\S+')
+_SECTION_HEADING = re.compile(r'^#{2,3}\s+(.+)', re.MULTILINE)
 
 
 def check_qualitative_conciseness(skill_path: 'Path', skill_content: str) -> list[str]:
@@ -749,18 +795,24 @@ def check_qualitative_conciseness(skill_path: 'Path', skill_content: str) -> lis
 
     # ── Detector 1: Legacy/deprecated blocks ────────────────────────────────
     legacy_blocks: list[tuple[int, int]] = []  # (start_line, end_line) 1-indexed
-    block_start: int | None = None
-    for i, line in enumerate(lines, 1):
-        is_match = any(pat.search(line) for pat in _LEGACY_MARKERS)
-        if is_match:
-            if block_start is None:
-                block_start = i
-        else:
-            if block_start is not None:
-                legacy_blocks.append((block_start, i - 1))
-                block_start = None
-    if block_start is not None:
-        legacy_blocks.append((block_start, len(lines)))
+    lowered = skill_content.lower()
+    if any(word in lowered for word in _LEGACY_KEYWORDS):
+        # Scan the whole buffer once and map match offsets back to line
+        # numbers, rather than running the markers against every line.
+        # No marker can span a line break, so a line matches if any match
+        # starts on it.
+        line_starts = [0]
+        line_starts.extend(m.end() for m in _LINE_BREAK.finditer(skill_content))
+        matched = sorted({
+            bisect.bisect_right(line_starts, m.start())
+            for m in _LEGACY_MARKER.finditer(skill_content)
+        })
+        # Collapse runs of consecutive matched lines into blocks
+        for line_no in matched:
+            if legacy_blocks and legacy_blocks[-1][1] == line_no - 1:
+                legacy_blocks[-1] = (legacy_blocks[-1][0], line_no)
+            else:
+                legacy_blocks.append((line_no, line_no))
 
     for start, end in legacy_blocks:
         size = end - start + 1
@@ -772,11 +824,11 @@ def check_qualitative_conciseness(skill_path: 'Path', skill_content: str) -> lis
 
     # ── Detector 2: Inline content before "See references/" pointer ─────────
     for i, line in enumerate(lines):
-        if _REFERENCE_POINTER.search(line):
+        if 'references/' in line and _REFERENCE_POINTER.search(line):
             # Count non-empty lines in the 8 lines before this one
             preceding = [l for l in lines[max(0, i - 8):i] if l.strip()]
             if len(preceding) >= 5:
-                ref_match = re.search(r'references/\S+', line)
+                ref_match = _REFERENCE_PATH.search(line)
                 ref_name = ref_match.group(0).rstrip('`).') if ref_match else 'references/'
                 warnings.append(
                     f'⚠ Qualitative: inline block before "{ref_name}" pointer '
@@ -787,13 +839,12 @@ def check_qualitative_conciseness(skill_path: 'Path', skill_content: str) -> lis
     # ── Detector 3: Reference heading duplication ────────────────────────────
     refs_dir = Path(skill_path) / 'references'
     if refs_dir.exists():
-        heading_pat = re.compile(r'^#{2,3}\s+(.+)', re.MULTILINE)
         for ref_file in refs_dir.glob('*.md'):
             try:
-                ref_text = ref_file.read_text()
+                ref_text = read_resource_text(ref_file)
             except Exception:
                 continue
-            for heading_match in heading_pat.finditer(ref_text):
+            for heading_match in _SECTION_HEADING.finditer(ref_text):
                 heading = heading_match.group(1).strip()
                 # Only flag headings with ≥3 words (avoids generic "Overview", "Usage", etc.)
                 if len(heading.split()) >= 3 and heading in skill_content:
@@ -1148,7 +1199,7 @@ def calculate_reference_currency_score(skill_path):
     has_provenance = False
     for ref_path in refs_dir.glob('*.md'):
         try:
-            text = ref_path.read_text()
+            text = read_resource_text(ref_path)
             if text.startswith('---') and 'last_verified' in text[:500]:
                 has_provenance = True
                 break
@@ -1302,6 +1353,9 @@ def validate_naming_conventions(skill_path, frontmatter_dict):
     }
 
 
+_REFERENCE_FILENAME = re.compile(r'^[a-z0-9_-]+\.md$')
+
+
 def validate_file_references(skill_path, body):
     """
     Validate file references use relative paths and follow best practices.
@@ -1361,7 +1415,7 @@ def validate_file_references(skill_path, body):
                 warnings.append(f"Orphaned reference file not mentioned in SKILL.md: `references/{filename}`")
 
             # Check naming convention (should be snake_case.md)
-            if not re.match(r'^[a-z0-9_-]+\.md$', filename):
+            if not _REFERENCE_FILENAME.match(filename):
                 warnings.append(f"Reference file should use snake_case naming: {filename} → {filename.lower().replace(' ', '_').replace('-', '_')}")
 
     return {
@@ -1468,6 +1522,9 @@ def validate_skill_loading(skill_path):
         }
 
 
+_SCRIPT_SUFFIXES = frozenset({'.py', '.sh', '.bash'})
+
+
 def validate_scripts(skill_path):
     """
     Check that bundled scripts are executable
@@ -1492,7 +1549,7 @@ def validate_scripts(skill_path):
 
             # Check if file is executable
             is_executable = os.access(script_file, os.X_OK)
-            if not is_executable and script_file.suffix in ['.py', '.sh', '.bash']:
+            if not is_executable and script_file.suffix in _SCRIPT_SUFFIXES:
                 issues.append(f"Script is not executable (chmod +x may be needed)")
 
             # Check for shebang
@@ -1539,14 +1596,13 @@ def validate_references_readable(skill_path):
             size_kb = 0
 
             try:
-                with open(ref_file, 'r') as f:
-                    content = f.read()
-                    readable = True
-                    size_kb = len(content) / 1024
-
-                    # Warn if very large
-                    if size_kb > 100:
-                        issues.append(f"Large file ({size_kb:.1f} KB); consider including grep patterns in SKILL.md")
+                content = read_resource_text(ref_file)
+                readable = True
+                size_kb = len(content) / 1024
+
+                # Warn if very large
+                if size_kb > 100:
+                    issues.append(f"Large file ({size_kb:.1f} KB); consider including grep patterns in SKILL.md")
             except Exception as e:
                 issues.append(f"Could not read file: {str(e)}")
 
@@ -1624,10 +1680,9 @@ def validate_reference_catalog(skill_path):
             f'references/{ref}',
             f'`{ref}`',
         ]
-        if any(p in content for p in patterns):
-            return True
-        # Also match markdown link syntax: [any text](references/filename.md)
-        return bool(re.search(rf'\(references/{re.escape(ref)}\)', content))
+        # Markdown link syntax, [any text](references/filename.md), is
+        # covered by the plain `references/{ref}` substring
+        return any(p in content for p in patterns)
 
     orphaned_refs = []
     for ref in actual_refs:
@@ -1647,6 +1702,15 @@ def validate_reference_catalog(skill_path):
     }
 
 
+_WORD = re.compile(r'\b[a-zA-Z][a-zA-Z0-9\-_]{2,}\b')
+_HEADING = re.compile(r'^#{1,3}\s+(.+)$', re.MULTILINE)
+_STOP_WORDS = frozenset({
+    'the', 'and', 'for', 'with', 'this', 'that', 'from', 'about',
+    'how', 'what', 'when', 'where', 'which', 'who', 'will', 'can',
+    'are', 'was', 'were', 'been', 'have', 'has', 'had', 'does', 'did',
+})
+
+
 def detect_duplicate_references(skill_path):
     """
     Detect consolidation opportunities in references/ using Jaccard similarity.
@@ -1665,11 +1729,7 @@ def detect_duplicate_references(skill_path):
         return []
 
     def _tokenize(text):
-        words = re.findall(r'\b[a-zA-Z][a-zA-Z0-9\-_]{2,}\b', text.lower())
-        common = {'the', 'and', 'for', 'with', 'this', 'that', 'from', 'about',
-                  'how', 'what', 'when', 'where', 'which', 'who', 'will', 'can',
-                  'are', 'was', 'were', 'been', 'have', 'has', 'had', 'does', 'did'}
-        return set(w for w in words if w not in common)
+        return set(_WORD.findall(text.lower())) - _STOP_WORDS
 
     def _jaccard(a, b):
         union = a | b
@@ -1681,10 +1741,10 @@ def detect_duplicate_references(skill_path):
         if ref_file.name.startswith('.'):
             continue
         try:
-            content = ref_file.read_text(encoding='utf-8')
+            content = read_resource_text(ref_file)
         except Exception:
             continue
-        headings = re.findall(r'^#{1,3}\s+(.+)$', content, re.MULTILINE)
+        headings = _HEADING.findall(content)
         paras = [p.strip() for p in content.split('\n\n') if p.strip() and not p.strip().startswith('#')]
         text = ' '.join(headings) + ' ' + (paras[0][:300] if paras else '')
         tokens_by_file[ref_file.name] = _tokenize(text)
@@ -1993,6 +2053,12 @@ AUTOGEN_BEGIN = ("<!-- BEGIN AUTOGEN:{id} "
 AUTOGEN_END = "<!-- END AUTOGEN:{id} -->"
 
 
+@functools.lru_cache(maxsize=8)
+def _field_pattern(key):
+    """Compiled `key: value` line matcher, built once per frontmatter key."""
+    return re.compile(rf'^{re.escape(key)}\s*:\s*(.*)$')
+
+
 def _frontmatter_field(md_path, key):
     """Extract a single frontmatter field without a full YAML parse.
 
@@ -2011,8 +2077,9 @@ def _frontmatter_field(md_path, key):
     if len(parts) < 3:
         return ''
     lines = parts[1].splitlines()
+    field_pat = _field_pattern(key)
     for idx, line in enumerate(lines):
-        m = re.match(rf'^{re.escape(key)}\s*:\s*(.*)$', line)
+        m = field_pat.match(line)
         if not m:
             continue
         val = m.group(1).strip()
@@ -2404,6 +2471,9 @@ def fold_patch_into_minor(skill_path, version, metrics, today):
     return 'folded', f"{parent} ({marker})"
 
 
+_VERSION_ROW = re.compile(r'^\|\s*(\d+\.\d+\.\d+)\s*\|')
+
+
 def audit_version_history(skill_path):
     """Scan a skill's Version History table for stray PATCH rows.
 
@@ -2427,7 +2497,7 @@ def audit_version_history(skill_path):
 
     patch_rows = []
     for line in content[start:end].splitlines():
-        hm = re.match(r'^\|\s*(\d+\.\d+\.\d+)\s*\|', line)
+        hm = _VERSION_ROW.match(line)
         if hm:
             v = _parse_semver(hm.group(1))
             if v and v[2] != 0:
@@ -2529,11 +2599,11 @@ def _readme_current_score(skill_path):
     readme = plugin_root / 'README.md'
     if not readme.exists():
         return None
-    start, end = _find_skill_section_range(readme.read_text(encoding='utf-8'), sp.name)
+    content = readme.read_text(encoding='utf-8')
+    start, end = _find_skill_section_range(content, sp.name)
     if start is None:
         return None
-    section = readme.read_text(encoding='utf-8')[start:end]
-    m = re.search(r'\*\*Score:\s*(\d{1,3})/100', section)
+    m = re.search(r'\*\*Score:\s*(\d{1,3})/100', content[start:end])
     return int(m.group(1)) if m else None
 
 
@@ -3840,7 +3910,10 @@ def main():
                         )
                 for ref_file in refs_dir.glob('*.md'):
                     try:
-                        size_kb = len(ref_file.read_text(encoding='utf-8').encode()) / 1024
+                        # Decode to confirm the file is readable, but take the
+                        # size from stat rather than re-encoding the text
+                        read_resource_text(ref_file)
+                        size_kb = ref_file.stat().st_size / 1024
                         if size_kb > 100:
                             structure['warnings'].append(
                                 f"{ref_file.name}: Large file ({size_kb:.1f} KB)"
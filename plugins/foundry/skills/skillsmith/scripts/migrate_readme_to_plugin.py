@@ -154,12 +154,9 @@ def main():
         if not (plugin_dir / '.claude-plugin').exists():
             continue
 
-        print(f"Processing: {plugin_dir.name}")
         actions = migrate_plugin(plugin_dir, dry_run=args.dry_run)
         all_actions.extend(actions)
-        for action in actions:
-            print(action)
-        print()
+        print("\n".join([f"Processing: {plugin_dir.name}", *actions, ""]))
 
     # Summary
     merges = sum(1 for a in all_actions if 'MERGE' in a)
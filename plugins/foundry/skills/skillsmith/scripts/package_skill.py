@@ -27,6 +27,8 @@ Examples:
 
 import argparse
 import fnmatch
+import functools
+import os
 import re
 import sys
 import zipfile
@@ -81,23 +83,48 @@ def load_skillignore(skill_root: Path) -> list[str]:
     return patterns
 
 
+@functools.lru_cache(maxsize=None)
+def _compile_ignore(patterns: tuple[str, ...]) -> tuple[frozenset[str], re.Pattern | None]:
+    """Split ignore patterns into directory names and one combined glob regex.
+
+    Directory patterns (ending in /) become a set of path components; all
+    other globs are translated once and joined into a single alternation,
+    so each path costs two regex matches instead of two fnmatch calls per
+    pattern.
+    """
+    dir_names = frozenset(p.rstrip("/") for p in patterns if p.endswith("/"))
+    globs = [
+        fnmatch.translate(os.path.normcase(p))
+        for p in patterns if not p.endswith("/")
+    ]
+    return dir_names, re.compile("|".join(globs)) if globs else None
+
+
 def is_ignored(path: Path, skill_root: Path, patterns: list[str]) -> bool:
     """Return True if the path matches any ignore pattern."""
-    rel = path.relative_to(skill_root)
-    rel_str = str(rel)
-
-    for pattern in patterns:
-        # Directory pattern (ends with /)
-        if pattern.endswith("/"):
-            dir_name = pattern.rstrip("/")
-            # Check if any component of the path matches
-            if any(part == dir_name for part in rel.parts):
-                return True
-        else:
-            # Match against the full relative path and the filename
-            if fnmatch.fnmatch(rel_str, pattern) or fnmatch.fnmatch(path.name, pattern):
-                return True
-    return False
+    return _is_ignored_rel(str(path.relative_to(skill_root)), patterns)
+
+
+def _is_ignored_rel(rel: str, patterns: list[str]) -> bool:
+    """is_ignored() for a path already relative to the skill root.
+
+    Works on the plain string so callers walking the tree never build Path
+    objects for files that end up excluded.
+    """
+    dir_names, glob_re = _compile_ignore(tuple(patterns))
+    parts = rel.split(os.sep)
+
+    # Directory pattern: any component of the path matches
+    if not dir_names.isdisjoint(parts):
+        return True
+
+    # Match against the full relative path and the filename
+    if glob_re is None:
+        return False
+    return bool(
+        glob_re.match(os.path.normcase(rel))
+        or glob_re.match(os.path.normcase(parts[-1]))
+    )
 
 
 def parse_frontmatter(skill_md: Path) -> dict:
@@ -178,17 +205,27 @@ def collect_files(skill_root: Path, patterns: list[str]) -> list[Path]:
         if lic.exists() and not is_ignored(lic, skill_root, patterns):
             included.append(lic)
 
-    # Walk only spec-defined directories
+    # Walk only spec-defined directories. Every path found lies under
+    # skill_root, so its relative form is a plain string slice.
+    prefix_len = len(str(skill_root)) + len(os.sep)
+    ignored_dirs = _compile_ignore(tuple(patterns))[0]
     for dir_name in sorted(SPEC_DIRS):
         spec_dir = skill_root / dir_name
-        if not spec_dir.is_dir():
+        if dir_name in ignored_dirs or not spec_dir.is_dir():
             continue
-        for file_path in sorted(spec_dir.rglob("*")):
-            if not file_path.is_file():
-                continue
-            if is_ignored(file_path, skill_root, patterns):
-                continue
-            included.append(file_path)
+        found = []
+        for root, dirs, files in os.walk(spec_dir):
+            # Prune ignored directories here so their subtrees (node_modules/,
+            # build/, ...) are never listed
+            dirs[:] = [d for d in dirs if d not in ignored_dirs]
+            rel_root = root[prefix_len:]
+            for name in files:
+                if _is_ignored_rel(os.path.join(rel_root, name), patterns):
+                    continue
+                file_path = os.path.join(root, name)
+                if os.path.isfile(file_path):
+                    found.append(Path(file_path))
+        included.extend(sorted(found))
 
     return included
 
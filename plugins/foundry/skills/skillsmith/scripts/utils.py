@@ -3,6 +3,7 @@
 # ///
 """Shared utilities for skillsmith scripts."""
 
+import functools
 import re
 import sys
 from pathlib import Path
@@ -13,30 +14,18 @@ SKILL_NAME_PATTERN = re.compile(r'^[a-z][a-z0-9]*(-[a-z0-9]+)*$')
 SKILL_NAME_MAX_LENGTH = 64
 
 
-def find_repo_root(start_path=None):
-    """Find repository root by searching for .git or .claude-plugin directory.
-
-    Args:
-        start_path: Starting directory (defaults to current directory)
+@functools.lru_cache(maxsize=None)
+def _find_upward(start_path, markers):
+    """Return the first directory at or above start_path containing a marker.
 
-    Returns:
-        Path to repository root, or None if not found
+    Cached per (start, markers) so scripts that resolve the same root from
+    several checks walk the tree and stat the markers only once.
     """
-    if start_path is None:
-        start_path = Path.cwd()
-    else:
-        start_path = Path(start_path).resolve()
-
     current = start_path
 
     # Search up to 10 levels (prevent infinite loops)
     for _ in range(10):
-        # Check for .git directory (most reliable)
-        if (current / ".git").exists():
-            return current
-
-        # Check for .claude-plugin directory
-        if (current / ".claude-plugin").exists():
+        if any((current / marker).exists() for marker in markers):
             return current
 
         # Move to parent
@@ -48,6 +37,24 @@ def find_repo_root(start_path=None):
     return None
 
 
+def find_repo_root(start_path=None):
+    """Find repository root by searching for .git or .claude-plugin directory.
+
+    Args:
+        start_path: Starting directory (defaults to current directory)
+
+    Returns:
+        Path to repository root, or None if not found
+    """
+    if start_path is None:
+        start_path = Path.cwd()
+    else:
+        start_path = Path(start_path).resolve()
+
+    # .git is the most reliable marker, then .claude-plugin
+    return _find_upward(start_path, (".git", ".claude-plugin"))
+
+
 def find_plugin_root(start_path=None):
     """Find the nearest plugin root by searching up for .claude-plugin/plugin.json.
 
@@ -66,19 +73,7 @@ def find_plugin_root(start_path=None):
     else:
         start_path = Path(start_path).resolve()
 
-    current = start_path
-
-    for _ in range(10):
-        plugin_json = current / ".claude-plugin" / "plugin.json"
-        if plugin_json.exists():
-            return current
-
-        parent = current.parent
-        if parent == current:
-            break
-        current = parent
-
-    return None
+    return _find_upward(start_path, (".claude-plugin/plugin.json",))
 
 
 def validate_skill_name(name):
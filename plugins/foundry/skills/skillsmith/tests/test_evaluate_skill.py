@@ -14,9 +14,11 @@ Tests cover:
 - Conciseness scoring (deterministic, tiered)
 - Spec compliance (all AgentSkills requirements)
 - Naming conventions (hyphen-case, length limits)
+- Legacy/deprecated block detection (line numbers match a per-line scan)
 """
 
 import pytest
+import re
 import sys
 from pathlib import Path
 import tempfile
@@ -48,6 +50,8 @@ from evaluate_skill import (
     write_receipt,
     verify_receipt,
     RECEIPT_FILENAME,
+    check_qualitative_conciseness,
+    read_resource_text,
 )
 
 
@@ -583,5 +587,100 @@ class TestEvalReceipts:
         assert not ok
 
 
+class TestReadResourceText:
+    """Test the per-file read cache behind read_resource_text()"""
+
+    def test_repeated_reads_return_same_text(self, tmp_path):
+        ref = tmp_path / "guide.md"
+        ref.write_text("# Guide\n", encoding="utf-8")
+        assert read_resource_text(ref) == "# Guide\n"
+        assert read_resource_text(str(ref)) == "# Guide\n"
+
+    def test_edited_file_is_read_again(self, tmp_path):
+        ref = tmp_path / "guide.md"
+        ref.write_text("# Guide\n", encoding="utf-8")
+        assert read_resource_text(ref) == "# Guide\n"
+
+        ref.write_text("# Guide, revised\n", encoding="utf-8")
+        assert read_resource_text(ref) == "# Guide, revised\n"
+
+    def test_decode_errors_propagate(self, tmp_path):
+        blob = tmp_path / "image.bin"
+        blob.write_bytes(b"\xff\xfe\x00")
+        with pytest.raises(UnicodeDecodeError):
+            read_resource_text(blob)
+
+
+class TestLegacyBlockDetection:
+    """Test the legacy/deprecated detector in check_qualitative_conciseness()"""
+
+    # The original per-line implementation, kept as the reference
+    MARKERS = [
+        re.compile(r'\blegacy\b', re.IGNORECASE),
+        re.compile(r'\bdeprecated\b', re.IGNORECASE),
+        re.compile(r'prefer .+? instead', re.IGNORECASE),
+        re.compile(r'use .+? instead', re.IGNORECASE),
+        re.compile(r'\bold approach\b', re.IGNORECASE),
+    ]
+
+    def _per_line_blocks(self, content):
+        lines = content.splitlines()
+        blocks = []
+        block_start = None
+        for i, line in enumerate(lines, 1):
+            if any(pat.search(line) for pat in self.MARKERS):
+                if block_start is None:
+                    block_start = i
+            elif block_start is not None:
+                blocks.append((block_start, i - 1))
+                block_start = None
+        if block_start is not None:
+            blocks.append((block_start, len(lines)))
+        return blocks
+
+    def _blocks(self, tmp_path, content):
+        warnings = check_qualitative_conciseness(tmp_path / 'missing-skill', content)
+        found = []
+        for w in warnings:
+            m = re.search(r'legacy/deprecated block \(~(\d+) line\(s\), line (\d+)\)', w)
+            if m:
+                start = int(m.group(2))
+                found.append((start, start + int(m.group(1)) - 1))
+        return found
+
+    @pytest.mark.parametrize('content', [
+        'Legacy API below\nplain\nplain\n',
+        'plain\nplain\nThis is deprecated',
+        'plain\nplain\nuse the new client instead\n',
+        'Deprecated\nlegacy too\nplain\nold approach\nprefer x instead',
+        'legacy',
+        '',
+        'plain\n\nno markers here\n',
+        'prefer\ninstead\nuse\ninstead',
+        'xlegacy legacyx\nlegacy,\n',
+        'use a\r\nlegacy\r\nplain\r\nuse b instead\r\n',
+        'use a\rinstead\rlegacy\rplain',
+        'plain\u2028legacy\u2028plain\nuse a\x0cb instead',
+        'use ın\u017ftead of it\nplain\nprefer this ınstead',
+    ])
+    def test_matches_per_line_scan(self, tmp_path, content):
+        assert self._blocks(tmp_path, content) == self._per_line_blocks(content)
+
+    def test_marker_on_first_and_last_line(self, tmp_path):
+        content = 'legacy setup\nplain\nplain\nold approach, no trailing newline'
+        assert self._blocks(tmp_path, content) == [(1, 1), (4, 4)]
+
+    def test_consecutive_lines_collapse(self, tmp_path):
+        content = 'plain\nlegacy one\ndeprecated two\nuse x instead\nplain\n'
+        warnings = check_qualitative_conciseness(tmp_path / 'missing-skill', content)
+        legacy = [w for w in warnings if 'legacy/deprecated block' in w]
+        assert len(legacy) == 1
+        assert '(~3 line(s), line 2): "legacy one"' in legacy[0]
+
+    def test_marker_does_not_span_lines(self, tmp_path):
+        content = 'use the\nnew one instead\nprefer a\r\nb instead'
+        assert self._blocks(tmp_path, content) == []
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
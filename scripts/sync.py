@@ -11,17 +11,78 @@ For each plugin with a relative source path:
 3. Compare with marketplace.json and update where they differ
 
 Stdlib-only. Uses pyyaml when available for frontmatter parsing, falls back
-to a minimal subset parser.
+to a minimal subset parser. Uses orjson when available for JSON reads and
+writes.
 """
 
 import argparse
+import functools
 import json
+import os
+import re
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# -- JSON helpers (orjson when available, stdlib otherwise) ------------------
+
+def _load_json(path: Path):
+    """Read and parse a JSON file.
+
+    Raises json.JSONDecodeError on invalid JSON (orjson's error subclasses it).
+    """
+    raw = path.read_bytes()
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def _dump_json(data) -> bytes:
+    """Serialize to 2-space indented UTF-8 JSON, identical on both backends."""
+    if orjson:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
 
 # -- YAML frontmatter parsing ------------------------------------------------
 
+# Fast path for version lookup: the frontmatter block, then a top-level
+# ``version:`` or one directly under ``metadata:``. The regexes only answer
+# for values YAML loads as that exact string -- quoted strings and dotted
+# x.y.z versions. Anything else (1.10, null, block scalars) goes through
+# the full parse, so both paths agree.
+_FRONTMATTER_RE = re.compile(r"\A---[ \t]*\n(.*?)^---", re.S | re.M)
+_TOP_VERSION_RE = re.compile(r"^version:(.*)$", re.M)
+# The first key under ``metadata:`` sets the indentation of its children;
+# ``version:`` must sit at exactly that level, not in a nested mapping
+_META_VERSION_RE = re.compile(
+    r"^metadata:[ \t]*(?:#.*)?\n"
+    r"(?:[ \t]*(?:#.*)?\n)*"
+    r"([ \t]+)(?:\S.*\n(?:\1.*\n|[ \t]*(?:#.*)?\n)*?\1)?"
+    r"version:(.*)$",
+    re.M,
+)
+_VERSION_VALUE_RE = re.compile(
+    r"[ \t]+(?:(['\"])([^'\"\\\n]+)\1|(v?\d+\.\d+\.\d+[-+.\w]*))"
+    r"(?:[ \t]+#.*)?[ \t]*"
+)
+
+
+def _match_version(frontmatter: str) -> str | None:
+    """Read the version from frontmatter text, or None if a parse is needed."""
+    line = (_TOP_VERSION_RE.search(frontmatter)
+            or _META_VERSION_RE.search(frontmatter))
+    if line is None:
+        return None
+    value = _VERSION_VALUE_RE.fullmatch(line.group(line.re.groups))
+    if value is None:
+        return None
+    return value.group(2) or value.group(3)
+
+
 def parse_frontmatter(text: str) -> dict:
     """Parse YAML frontmatter from a Markdown file."""
     if not text.startswith("---"):
@@ -70,37 +131,61 @@ def _parse_frontmatter_stdlib(raw: str) -> dict:
 
 # -- Version resolution ------------------------------------------------------
 
+def _read_frontmatter_prefix(skill_md: Path) -> str:
+    """Read a Markdown file only up to the end of its frontmatter block.
+
+    The body after the closing ``---`` is never read, so large SKILL.md files
+    cost no more than their header. Files without frontmatter stop after the
+    first line.
+    """
+    with open(skill_md, encoding="utf-8") as f:
+        lines = [f.readline()]
+        if not lines[0].startswith("---"):
+            return lines[0]
+        for line in f:
+            lines.append(line)
+            if line.startswith("---"):
+                break
+    return "".join(lines)
+
+
+@functools.lru_cache(maxsize=None)
 def resolve_version(plugin_dir: Path) -> tuple[str | None, str]:
     """Resolve the authoritative version for a plugin directory.
 
     Returns (version, source_label) where source_label describes where
-    the version came from (for reporting).
+    the version came from (for reporting). Results are cached per path so
+    marketplace entries sharing a source directory are resolved once.
 
     Priority:
     1. .claude-plugin/plugin.json "version" field
     2. Single skill SKILL.md frontmatter "version" field
     """
     # Try plugin.json first
+    # Open directly rather than stat first; a missing file is just an OSError
     plugin_json = plugin_dir / ".claude-plugin" / "plugin.json"
-    if plugin_json.is_file():
-        try:
-            with open(plugin_json) as f:
-                data = json.load(f)
-            version = data.get("version")
-            if version:
-                return version, "plugin.json"
-        except (json.JSONDecodeError, OSError):
-            pass
-
-    # Fall back to SKILL.md frontmatter
+    try:
+        version = _load_json(plugin_json).get("version")
+        if version:
+            return version, "plugin.json"
+    except (json.JSONDecodeError, OSError):
+        pass
+
+    # Fall back to SKILL.md frontmatter. One scandir of skills/ (d_type, no
+    # per-entry stat); a missing skills/ or plugin dir is just an OSError.
     skills_dir = plugin_dir / "skills"
-    if not skills_dir.is_dir():
+    try:
+        with os.scandir(skills_dir) as it:
+            skill_names = sorted(
+                entry.name for entry in it
+                if entry.is_dir() and not entry.name.startswith(".")
+            )
+    except OSError:
         return None, "no source"
 
     skill_dirs = [
-        d for d in sorted(skills_dir.iterdir())
-        if d.is_dir() and not d.name.startswith(".")
-        and (d / "SKILL.md").exists()
+        skills_dir / name for name in skill_names
+        if (skills_dir / name / "SKILL.md").exists()
     ]
 
     if len(skill_dirs) == 0:
@@ -112,10 +197,17 @@ def resolve_version(plugin_dir: Path) -> tuple[str | None, str]:
     # Single skill -- extract version from frontmatter
     skill_md = skill_dirs[0] / "SKILL.md"
     try:
-        text = skill_md.read_text(encoding="utf-8")
+        text = _read_frontmatter_prefix(skill_md)
     except OSError:
         return None, "read error"
 
+    block = _FRONTMATTER_RE.match(text)
+    if block:
+        version = _match_version(block.group(1))
+        if version:
+            return version, f"SKILL.md ({skill_dirs[0].name})"
+
+    # Unusual layouts (flow mappings, block scalars) -- full parse
     fm = parse_frontmatter(text)
     version = fm.get("version")
     if not version:
@@ -146,10 +238,8 @@ def sync_versions(config: dict, repo_root: Path, dry_run: bool) -> list[dict]:
         if not isinstance(source, str) or not source.startswith("./"):
             continue
 
+        # No is_dir() pre-check: a missing source resolves to "no source"
         plugin_dir = repo_root / source
-        if not plugin_dir.is_dir():
-            continue
-
         source_version, source_label = resolve_version(plugin_dir)
 
         if source_version is None:
@@ -206,8 +296,7 @@ def main() -> None:
     repo_root = mp_path.parent.parent
 
     try:
-        with open(mp_path) as f:
-            config = json.load(f)
+        config = _load_json(mp_path)
     except json.JSONDecodeError as e:
         print(f"Invalid JSON in {mp_path}: {e}", file=sys.stderr)
         sys.exit(1)
@@ -226,9 +315,7 @@ def main() -> None:
 
     # Write updated config
     if not args.dry_run:
-        with open(mp_path, "w") as f:
-            json.dump(config, f, indent=2, ensure_ascii=False)
-            f.write("\n")
+        mp_path.write_bytes(_dump_json(config) + b"\n")
         print(f"\n{len(changes)} version(s) synced to {mp_path}")
     else:
         print(f"\n{len(changes)} version(s) would be updated. "